@@ -0,0 +1,169 @@
+"""
+Generador de avisos sintéticos en español e inglés para los benchmarks.
+
+Los títulos y descripciones se arman con los términos de
+filters_scoring_config (roles, tecnologías, seniority, áreas excluidas,
+modalidad y requisitos de experiencia), así el corpus ejercita las mismas
+ramas del pre-filtro y del scoring que los avisos reales.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import filters_scoring_config as scoring_config
+
+_TITLE_TEMPLATES = {
+    "es": [
+        "{seniority} {role}",
+        "{role} {seniority} {tech}",
+        "{role} {tech}",
+        "{seniority} {area}",
+        "{ambiguous} {seniority}",
+        "{excluded} {role}",
+    ],
+    "en": [
+        "{seniority} {role}",
+        "{seniority} {tech} {role}",
+        "{role} - {tech}",
+        "{area} {seniority}",
+        "{ambiguous} ({seniority})",
+        "{excluded} {tech} {role}",
+    ],
+}
+
+_SENTENCES = {
+    "es": [
+        "Buscamos {role} para sumarse a nuestro equipo de {tag}.",
+        "Trabajarás con {tech}, {tech} y {tech} en proyectos de clientes.",
+        "Modalidad {modality}, con horario flexible.",
+        "Requisitos: {experience} y conocimientos de {tech}.",
+        "Valoramos experiencia en {tag} y ganas de aprender.",
+        "Ofrecemos capacitación, obra social y bono anual.",
+        "Es un plus haber trabajado con {tech}.",
+        "Posición ideal para {seniority} con interés en {tag}.",
+    ],
+    "en": [
+        "We are looking for a {role} to join our {tag} team.",
+        "You will work with {tech}, {tech} and {tech} on client projects.",
+        "This is a {modality} position with flexible hours.",
+        "Requirements: {experience} and hands-on {tech}.",
+        "Experience with {tag} is a strong plus.",
+        "We offer training, health insurance and an annual bonus.",
+        "Nice to have: {tech}.",
+        "Great fit for a {seniority} interested in {tag}.",
+    ],
+}
+
+_EXPERIENCE = {
+    "es": [
+        "sin experiencia previa",
+        "{years} años de experiencia",
+        "mínimo {years} años",
+        "al menos {years} años en roles similares",
+        "experiencia de {years} años",
+        "{years}-{years_max} años",
+    ],
+    "en": [
+        "no experience required",
+        "{years} years of experience",
+        "at least {years} years",
+        "minimum {years} years",
+        "{years}+ years",
+        "{years} to {years_max} years",
+    ],
+}
+
+_COMPANIES = ["Acme", "Globant", "Mercado", "Nimbus", "Patagonia Labs", "Andes Tech"]
+_SOURCES = ["GetOnBoard", "EducacionIT", "LinkedIn", "Indeed"]
+
+_TERM_POOLS = {
+    "seniority": sorted(scoring_config.POSITIVE_SENIORITY_TERMS)
+    + scoring_config.EXCLUDED_SENIORITYS,
+    "role": sorted(scoring_config.STRONG_ROLE_SIGNALS),
+    "tech": sorted(scoring_config.STRONG_TECH_SIGNALS),
+    "area": sorted(scoring_config.WEAK_IT_SIGNALS),
+    "ambiguous": sorted(scoring_config.AMBIGUOUS_ROLES),
+    "excluded": scoring_config.EXCLUDED_AREA_TERMS_TITLE,
+    "tag": [
+        keyword
+        for keywords in scoring_config.TAGS_KEYWORDS.values()
+        for keyword in keywords
+    ],
+    "modality": [
+        term for terms in scoring_config.MODALITY_TERMS.values() for term in terms
+    ],
+}
+
+
+def generate_jobs(rows, seed=0):
+    """
+    Genera `rows` avisos con las columnas que entregan los fetchers
+    (id, title, company, description, url, salary, source, published_at).
+    Con la misma semilla el corpus es siempre el mismo.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    jobs = []
+
+    for index in range(rows):
+        language = "es" if rng.random() < 0.6 else "en"
+        fill = _Filler(rng, language)
+
+        title = fill(rng.choice(_TITLE_TEMPLATES[language]))
+        sentences = rng.sample(_SENTENCES[language], rng.randint(3, 7))
+        description = " ".join(fill(sentence) for sentence in sentences)
+        if rng.random() < 0.3:
+            # Algunas descripciones llegan con HTML
+            description = f"<p>{description}</p><ul><li>{fill('{tech}')}</li></ul>"
+
+        published = now - timedelta(minutes=rng.randint(0, 3 * 24 * 60))
+        source = rng.choice(_SOURCES)
+        jobs.append(
+            {
+                "id": f"bench-{seed}-{index}",
+                "title": title,
+                "company": rng.choice(_COMPANIES),
+                "description": description,
+                "url": f"https://example.com/jobs/{index}",
+                "salary": None if rng.random() < 0.7 else "USD 1000 - 1500",
+                "source": source,
+                "published_at": _published_at(rng, source, published),
+            }
+        )
+    return jobs
+
+
+def _published_at(rng, source, published):
+    """Fecha en el formato que usa cada fuente."""
+    if source == "GetOnBoard":
+        return int(published.timestamp())
+    if source == "EducacionIT":
+        return published.strftime("%Y-%m-%d")
+    if rng.random() < 0.05:
+        return None
+    return published.date()
+
+
+class _Filler:
+    """Completa los placeholders de una plantilla con términos al azar."""
+
+    def __init__(self, rng, language):
+        self.rng = rng
+        self.language = language
+
+    def __call__(self, template):
+        text = template
+        while "{" in text:
+            start = text.index("{")
+            end = text.index("}", start)
+            text = text[:start] + self._term(text[start + 1 : end]) + text[end + 1 :]
+        text = text.strip()
+        return text[0].upper() + text[1:]
+
+    def _term(self, name):
+        if name == "experience":
+            years = self.rng.randint(1, 6)
+            return self.rng.choice(_EXPERIENCE[self.language]).format(
+                years=years, years_max=years + 2
+            )
+        return self.rng.choice(_TERM_POOLS[name])
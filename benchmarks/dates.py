@@ -0,0 +1,114 @@
+"""
+Compara la normalización de fechas fila por fila con dateparser (como se hacía
+antes) contra normalize_date_series, sobre una columna mixta como la que llega
+de las fuentes: strings ISO, timestamps, objetos date, vacíos y fechas relativas.
+
+Uso:
+    python benchmarks/dates.py [--rows 10000] [--runs 3]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.date_utils import (  # noqa: E402
+    _DATEPARSER_SETTINGS,
+    _parse_date_string,
+    normalize_date_series,
+    safe_parse_date_to_ISO,
+)
+
+
+def build_column(rows, seed=0):
+    """Columna sintética con la mezcla de formatos de las fuentes."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    values = []
+    for _ in range(rows):
+        moment = now - timedelta(seconds=rng.randint(0, 10 * 24 * 3600))
+        kind = rng.random()
+        if kind < 0.4:
+            values.append(moment.strftime("%Y-%m-%d"))  # EducacionIT
+        elif kind < 0.7:
+            values.append(int(moment.timestamp()))  # GetOnBoard
+        elif kind < 0.9:
+            values.append(moment.date())  # JobSpy
+        elif kind < 0.95:
+            values.append(moment.isoformat())
+        elif kind < 0.98:
+            values.append(None)
+        else:
+            values.append(rng.choice(["hace 2 días", "ayer", "yesterday"]))
+    return pd.Series(values, dtype=object)
+
+
+def legacy(series):
+    """Normalización anterior: dateparser para todo lo que no es numérico."""
+    import dateparser
+
+    def parse(value):
+        if value is None or isinstance(value, (int, float)):
+            return safe_parse_date_to_ISO(value)
+        parsed = dateparser.parse(
+            str(value), settings=_DATEPARSER_SETTINGS, languages=["es", "en"]
+        )
+        if not parsed:
+            return safe_parse_date_to_ISO(None)
+        return parsed.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
+
+    return pd.to_datetime(series.map(parse), errors="coerce", utc=True)
+
+
+def per_value(series):
+    return pd.to_datetime(series.map(safe_parse_date_to_ISO), errors="coerce", utc=True)
+
+
+def timed(func, series, runs, clear_cache=False):
+    timings = []
+    for _ in range(runs):
+        if clear_cache:
+            _parse_date_string.cache_clear()
+        start = time.perf_counter()
+        func(series)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    series = build_column(args.rows)
+    # dateparser se importa y calienta antes de medir
+    _parse_date_string("hace 1 día")
+
+    results = [
+        ("dateparser por fila", timed(legacy, series, args.runs)),
+        ("fast paths por fila (cache fría)", timed(per_value, series, args.runs, True)),
+        ("fast paths por fila (cache caliente)", timed(per_value, series, args.runs)),
+        (
+            "normalize_date_series",
+            timed(normalize_date_series, series, args.runs, True),
+        ),
+    ]
+
+    baseline = results[0][1]
+    for label, seconds in results:
+        print(
+            f"⏱️ {label}: {seconds * 1000:.1f} ms "
+            f"({baseline / seconds:.1f}x, {args.rows} filas, mediana de {args.runs})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Mide el tiempo desde el arranque del proceso hasta el primer job puntuado:
+construcción de los matchers, import del pipeline y primer score.
+
+Cada medición corre en un proceso nuevo.
+
+Uso:
+    python benchmarks/first_score.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MEASURE_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import pandas as pd
+matchers_start = time.perf_counter()
+import utils.constants
+matchers = time.perf_counter() - matchers_start
+from utils.scoring_utils import filter_jobs_with_scoring, normalize_text_series
+imported = time.perf_counter()
+
+df = pd.DataFrame([{
+    "title": "Desarrollador Python Junior",
+    "description": "Buscamos desarrollador trainee con conocimientos de python, django y sql.",
+}])
+df["title_normalized"] = normalize_text_series(df["title"])
+df["full_text_normalized"] = (
+    df["title_normalized"] + " " + normalize_text_series(df["description"])
+)
+filter_jobs_with_scoring(df, verbose=False)
+scored = time.perf_counter()
+
+print(json.dumps({
+    "matchers": matchers,
+    "import": imported - start,
+    "first_score": scored - start,
+}))
+"""
+
+
+def measure():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE_SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    import_ms = statistics.median(run["import"] for run in runs) * 1000
+    matchers_ms = statistics.median(run["matchers"] for run in runs) * 1000
+    score_ms = statistics.median(run["first_score"] for run in runs) * 1000
+    print(
+        f"⏱️ matchers {matchers_ms:.1f} ms, import {import_ms:.1f} ms, "
+        f"primer score {score_ms:.1f} ms (mediana de {len(runs)})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Compara el escáner de términos (trie) y la regex combinada de experiencia senior
+contra las implementaciones originales con `re`:
+
+- cada categoría del escáner contra su alternación `(?<!\\w)term(?!\\w)`
+  (search y findall, y el atajo del título como prefijo del texto completo);
+- find_senior_experience_requirement contra el loop de re.findall sobre
+  SENIOR_EXPERIENCE_PATTERNS;
+- extract_tags y extract_job_modality contra las versiones con una regex
+  por keyword / por modalidad.
+
+Los textos son un corpus sintético normalizado más casos borde escritos a mano.
+Sale con código 1 si encuentra alguna diferencia.
+
+Uso:
+    python benchmarks/matchers_equivalence.py [--rows 500] [--seed 0]
+"""
+
+import argparse
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from benchmarks.corpus import generate_jobs  # noqa: E402
+from benchmarks.pipeline import normalize  # noqa: E402
+from filters_scoring_config import (  # noqa: E402
+    MIN_YEARS_SENIORITY,
+    SENIOR_EXPERIENCE_PATTERNS,
+    TAGS_KEYWORDS,
+)
+from utils.constants import (  # noqa: E402
+    _FLEXIBLE_WHITESPACE_CATEGORIES,
+    _SCANNER_CATEGORIES,
+    _TEXT_SCANNER,
+)
+from utils.scraping_utils import extract_job_modality, extract_tags  # noqa: E402
+from utils.term_scanner import _ordered_terms  # noqa: E402
+from utils.text_analysis import find_senior_experience_requirement  # noqa: E402
+
+# Casos borde: límites de palabra, símbolos, espacios y números de años
+EDGE_CASES = [
+    "",
+    "it",
+    "it's an it role",
+    "c# y .net developer",
+    "node.js / react-native / xreact / react_native",
+    "_python python_ python3 (python)",
+    "sr. developer, ssr y semi-senior",
+    "pasantía para estudiantes avanzados",
+    "desde casa | desde\ncasa | desdecasa | desde  \t casa",
+    "work  from\thome o wfh, remote-first",
+    "100%presencial en caba",
+    "100 % presencial",
+    "exclusivamente   presencial en buenos aires",
+    "esquema híbrido (hybrid), mixto",
+    "remoto pero con viajes a la oficina",
+    "5+ years of experience",
+    "+3 años de experiencia",
+    "mínimo 4 años de experiencia comprobable",
+    "experiencia de 3 a 5 años",
+    "2-4 years experience, 10 years experience",
+    "1 año de experiencia, luego 3 años de experiencia",
+    "at least 3 years of experience in python",
+    "más de 2 años de experiencia, al menos 5 años de experiencia",
+    "99999999999999999999 years of experience",
+    "analista it de soporte it/helpdesk",
+    "ingeniero de datos junior / data engineer jr",
+    "devops sre cloud aws gcp azure kubernetes docker",
+]
+
+
+def build_reference_regexes():
+    """Alternación por categoría como la armaban los matchers con `re`."""
+    regexes = {}
+    for category, terms in _SCANNER_CATEGORIES.items():
+        escaped = [re.escape(term) for term in _ordered_terms(terms)]
+        if category in _FLEXIBLE_WHITESPACE_CATEGORIES:
+            escaped = [term.replace(r"\ ", r"\s*") for term in escaped]
+        regexes[category] = re.compile(
+            "|".join(r"(?<!\w)" + term + r"(?!\w)" for term in escaped),
+            re.IGNORECASE | re.UNICODE,
+        )
+    return regexes
+
+
+def reference_senior_experience(text):
+    """Loop original: el primer patrón que pida años suficientes gana."""
+    for pattern in SENIOR_EXPERIENCE_PATTERNS:
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            try:
+                years = int(match)
+            except ValueError:
+                continue
+            if years >= MIN_YEARS_SENIORITY:
+                return years, pattern
+    return None
+
+
+def reference_tags(text):
+    found_tags = {}
+    for category, keywords in TAGS_KEYWORDS.items():
+        found = [
+            kw
+            for kw in keywords
+            if re.search(r"(?<!\w)" + re.escape(kw) + r"(?!\w)", text, re.IGNORECASE)
+        ]
+        if found:
+            found_tags[category] = found
+    return found_tags
+
+
+def reference_modality(text):
+    if re.search(
+        r"\b(100%\s*(on-site|onsite|presencial)|exclusivamente\s*presencial)\b",
+        text,
+        re.IGNORECASE,
+    ):
+        return "On-site"
+
+    is_remote_mentioned = re.search(
+        r"\b(remoto|remote|desde\s*casa|work\s*from\s*home|wfh|teletrabajo|anywhere)\b",
+        text,
+        re.IGNORECASE,
+    )
+    is_onsite_mentioned = re.search(
+        r"\b(presencial|on-site|onsite|oficina|sede|caba|buenos\s*aires|viajes)\b",
+        text,
+        re.IGNORECASE,
+    )
+
+    if re.search(r"\b(híbrido|hybrid|mixto)\b", text, re.IGNORECASE) or (
+        is_remote_mentioned and is_onsite_mentioned
+    ):
+        return "Hybrid"
+    if is_onsite_mentioned:
+        return "On-site"
+    if is_remote_mentioned:
+        return "Remote"
+    return "Not Specified"
+
+
+def fixture_texts(rows, seed):
+    """(título, texto completo) normalizados del corpus más los casos borde."""
+    df = normalize(pd.DataFrame(generate_jobs(rows, seed=seed)))
+    pairs = list(zip(df["title_normalized"], df["full_text_normalized"]))
+    for case in EDGE_CASES:
+        pairs.append((case, case))
+        pairs.append((case, f"{case} {case}"))
+    return pairs
+
+
+def compare(pairs):
+    regexes = build_reference_regexes()
+    mismatches = []
+
+    def check(label, text, got, expected):
+        if got != expected:
+            mismatches.append((label, text, got, expected))
+
+    for title, full_text in pairs:
+        for text in (title, full_text):
+            matches = _TEXT_SCANNER.scan(text)
+            for category, regex in regexes.items():
+                check(
+                    f"search {category}",
+                    text,
+                    matches.search(category),
+                    bool(regex.search(text)),
+                )
+                check(
+                    f"findall {category}",
+                    text,
+                    matches.findall(category),
+                    regex.findall(text),
+                )
+
+            check(
+                "senior_experience",
+                text,
+                find_senior_experience_requirement(text),
+                reference_senior_experience(text),
+            )
+            check("tags", text, extract_tags(text), reference_tags(text))
+            check(
+                "modality", text, extract_job_modality(text), reference_modality(text)
+            )
+
+        # Atajo del título: sus señales se leen del escaneo del texto completo
+        if _TEXT_SCANNER.is_prefix(title, full_text):
+            from_prefix = _TEXT_SCANNER.scan(full_text).prefix(len(title))
+            from_title = _TEXT_SCANNER.scan(title)
+            for category in regexes:
+                check(
+                    f"prefix {category}",
+                    title,
+                    from_prefix.findall(category),
+                    from_title.findall(category),
+                )
+
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pairs = fixture_texts(args.rows, args.seed)
+    print(f"🔍 Comparando matchers sobre {len(pairs)} jobs...")
+    mismatches = compare(pairs)
+
+    if not mismatches:
+        print("✅ El escáner y la regex combinada coinciden con las regex originales.")
+        return
+
+    print(f"❌ {len(mismatches)} diferencias:")
+    for label, text, got, expected in mismatches[:20]:
+        print(
+            f"  - {label}: {text[:80]!r}\n      obtenido={got!r}\n      esperado={expected!r}"
+        )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
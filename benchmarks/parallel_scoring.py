@@ -0,0 +1,101 @@
+"""
+Compara el análisis + pre-filtro + scoring en un proceso contra el pool de
+procesos de filter_jobs_with_scoring, para elegir SCORING_PARALLEL_MIN_ROWS.
+
+Para cada tamaño mide las dos variantes y, con un ajuste lineal del costo
+extra del pool (arranque de los procesos + envío de textos y resultados),
+estima desde cuántas filas conviene el pool con 2, 4 y 8 cores. En una
+máquina de un solo core el pool no puede ganar, pero el costo extra medido
+sirve igual para la estimación.
+
+Uso:
+    python benchmarks/parallel_scoring.py [--sizes 2000 10000 40000] [--runs 3] [--processes 2]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from benchmarks.corpus import generate_jobs  # noqa: E402
+from benchmarks.pipeline import normalize  # noqa: E402
+from config import SCORING_PARALLEL_MIN_ROWS  # noqa: E402
+from utils.scoring_utils import (  # noqa: E402
+    _analyze_and_score_chunk,
+    _analyze_and_score_parallel,
+)
+from utils.text_analysis import get_text_column  # noqa: E402
+
+
+def measure(func, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 10000, 40000])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=2)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    print(f"🖥️ {cores} cores, pool de {args.processes} procesos")
+
+    points = []
+    for rows in args.sizes:
+        df = normalize(pd.DataFrame(generate_jobs(rows, seed=0)))
+        chunk = (
+            get_text_column(df, "title_normalized").tolist(),
+            get_text_column(df, "full_text_normalized").tolist(),
+        )
+        serial = measure(lambda: _analyze_and_score_chunk(chunk), args.runs)
+        parallel = measure(
+            lambda: _analyze_and_score_parallel(df, args.processes), args.runs
+        )
+        # Costo extra del pool: lo que tarda por encima del trabajo repartido
+        overhead = parallel - serial / min(args.processes, cores)
+        points.append((rows, serial, overhead))
+        winner = "pool" if parallel < serial else "un proceso"
+        print(
+            f"⏱️ {rows} filas: un proceso {serial:.2f}s, pool {parallel:.2f}s "
+            f"(costo extra {overhead:.2f}s) → gana {winner}"
+        )
+
+    if len(points) < 2:
+        return
+
+    # Ajuste lineal: trabajo = c·filas, costo extra del pool = a + b·filas
+    per_row = sum(serial for _, serial, _ in points) / sum(r for r, _, _ in points)
+    (r1, _, o1), (r2, _, o2) = points[0], points[-1]
+    per_row_overhead = max(0.0, (o2 - o1) / (r2 - r1))
+    fixed_overhead = max(0.0, o1 - per_row_overhead * r1)
+    print(
+        f"\n📐 {per_row * 1e6:.0f} µs/fila en un proceso; pool: "
+        f"{fixed_overhead:.2f}s fijos + {per_row_overhead * 1e6:.0f} µs/fila"
+    )
+
+    # El pool gana cuando c·n > a + b·n + c·n/N
+    for n_cores in (2, 4, 8):
+        gain = per_row * (1 - 1 / n_cores) - per_row_overhead
+        if gain <= 0:
+            print(f"   - {n_cores} cores: el pool no compensa con ningún tamaño")
+        else:
+            print(
+                f"   - {n_cores} cores: conviene desde ~{fixed_overhead / gain:.0f} filas"
+            )
+    print(f"   (SCORING_PARALLEL_MIN_ROWS actual: {SCORING_PARALLEL_MIN_ROWS})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Benchmark por etapa del pipeline de scoring sobre un corpus sintético.
+
+Mide por separado la normalización de texto y de fechas, el análisis de texto,
+tags, modalidad, pre-filtro y scoring, y además filter_jobs_with_scoring
+completo, para cada tamaño pedido. Los resultados se guardan en JSON (con el
+commit actual) para comparar entre commits con --compare.
+
+Uso:
+    python benchmarks/pipeline.py [--sizes 100 10000 100000] [--runs 3]
+    python benchmarks/pipeline.py --compare benchmarks/results/pipeline_abc1234.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from benchmarks.corpus import generate_jobs  # noqa: E402
+from utils.date_utils import (  # noqa: E402
+    _parse_date_string,
+    normalize_date_series,
+    safe_parse_date_to_ISO,
+)
+from utils.scoring_utils import (  # noqa: E402
+    calculate_job_score,
+    filter_jobs_with_scoring,
+    normalize_text_series,
+    pre_filter_jobs,
+)
+from utils.scraping_utils import extract_job_modality, extract_tags  # noqa: E402
+from utils.text_analysis import TEXT_ANALYSIS_COLUMN, analyze_texts  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# Diferencia relativa a partir de la cual --compare marca una etapa
+REGRESSION_THRESHOLD = 0.10
+
+
+def normalize(df):
+    """Columnas normalizadas como las arma _process_batch."""
+    df = df.copy()
+    df["title_normalized"] = normalize_text_series(df["title"])
+    df["description_normalized"] = normalize_text_series(df["description"])
+    df["full_text_normalized"] = (
+        df["title_normalized"] + " " + df["description_normalized"]
+    )
+    return df
+
+
+def parse_dates_per_value(dates):
+    # Cache vacía en cada corrida, como en un proceso nuevo
+    _parse_date_string.cache_clear()
+    return dates.map(safe_parse_date_to_ISO)
+
+
+def parse_dates_column(dates):
+    _parse_date_string.cache_clear()
+    return normalize_date_series(dates)
+
+
+def build_stages(df_raw):
+    """
+    Etapas a medir: (nombre, función sin argumentos). Las entradas de cada etapa
+    se preparan antes, así cada medición incluye solo esa etapa.
+    """
+    df_normalized = normalize(df_raw)
+    full_texts = df_normalized["full_text_normalized"]
+
+    df_analyzed = df_normalized.copy()
+    df_analyzed[TEXT_ANALYSIS_COLUMN] = analyze_texts(df_analyzed)
+    df_pre_filtered, _ = pre_filter_jobs(df_analyzed, verbose=False)
+
+    return [
+        ("normalize_text_series", lambda: normalize(df_raw)),
+        (
+            "safe_parse_date_to_ISO",
+            lambda: parse_dates_per_value(df_raw["published_at"]),
+        ),
+        (
+            "normalize_date_series",
+            lambda: parse_dates_column(df_raw["published_at"]),
+        ),
+        ("analyze_texts", lambda: analyze_texts(df_normalized)),
+        ("extract_tags", lambda: full_texts.map(extract_tags)),
+        ("extract_job_modality", lambda: full_texts.map(extract_job_modality)),
+        ("pre_filter_jobs", lambda: pre_filter_jobs(df_analyzed, verbose=False)),
+        (
+            "calculate_job_score",
+            lambda: df_pre_filtered.apply(calculate_job_score, axis=1),
+        ),
+        (
+            "filter_jobs_with_scoring",
+            lambda: filter_jobs_with_scoring(df_normalized, verbose=False),
+        ),
+    ]
+
+
+def run_size(rows, runs, seed):
+    df_raw = pd.DataFrame(generate_jobs(rows, seed=seed))
+    results = {}
+    for name, stage in build_stages(df_raw):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            stage()
+            timings.append(time.perf_counter() - start)
+        seconds = statistics.median(timings)
+        results[name] = {
+            "seconds": seconds,
+            "rows_per_second": rows / seconds if seconds else None,
+        }
+        print(
+            f"   {name:<26} {seconds * 1000:>10.1f} ms "
+            f"({rows / seconds:,.0f} filas/s)"
+        )
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current, previous_path):
+    """Imprime la variación de cada etapa contra un JSON anterior."""
+    with open(previous_path, encoding="utf-8") as f:
+        previous = json.load(f)
+
+    print(f"\n📊 Comparación contra {previous.get('commit', previous_path)}:")
+    regressions = 0
+    for size, stages in current["results"].items():
+        for name, result in stages.items():
+            before = previous.get("results", {}).get(size, {}).get(name)
+            if not before:
+                continue
+            change = result["seconds"] / before["seconds"] - 1
+            marker = ""
+            if change > REGRESSION_THRESHOLD:
+                marker = " ⚠️"
+                regressions += 1
+            print(f"   {size:>7} filas {name:<26} {change:+7.1%}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON de resultados (default: por commit)")
+    parser.add_argument("--compare", help="JSON de una corrida anterior")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "seed": args.seed,
+        "results": {},
+    }
+
+    for rows in args.sizes:
+        print(f"⏱️ {rows} filas (mediana de {args.runs} corridas)")
+        report["results"][str(rows)] = run_size(rows, args.runs, args.seed)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"pipeline_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Resultados guardados en {output}")
+
+    if args.compare and compare(report, args.compare):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark de arranque basado en `python -X importtime`.
+
+Mide cuánto tarda en importarse cada punto de entrada y verifica que los SDKs
+pesados (Firebase, Telegram, JobSpy) no se carguen al importar: se importan
+recién cuando se usan.
+
+Uso:
+    python benchmarks/startup.py [--max-seconds 2.0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_MODULES = ["utils.scoring_utils", "utils.scraping_utils", "main"]
+
+# Módulos que no deben importarse hasta el primer uso
+LAZY_MODULES = ["firebase_admin", "google.cloud.firestore_v1", "telegram", "jobspy"]
+
+
+def measure_import(module):
+    """
+    Importa `module` en un proceso nuevo con -X importtime.
+
+    Returns:
+        (segundos totales, {módulo: microsegundos acumulados})
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative_us, name = line.split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+
+    # El acumulado del módulo pedido excluye lo que importa el intérprete al arrancar
+    return cumulative.get(module, 0) / 1_000_000, cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    failed = False
+    for module in ENTRY_MODULES:
+        try:
+            seconds, cumulative = measure_import(module)
+        except ImportError as e:
+            print(f"❌ No se pudo importar {module}: {e}")
+            failed = True
+            continue
+        print(f"⏱️ import {module}: {seconds:.3f}s")
+
+        slowest = sorted(
+            (item for item in cumulative.items() if item[0] != module),
+            key=lambda item: -item[1],
+        )[:5]
+        for name, us in slowest:
+            print(f"   {us / 1000:8.1f} ms  {name}")
+
+        eager = [
+            lazy
+            for lazy in LAZY_MODULES
+            if any(name == lazy or name.startswith(lazy + ".") for name in cumulative)
+        ]
+        if eager:
+            print(f"❌ {module} importa al arrancar: {', '.join(eager)}")
+            failed = True
+        if seconds > args.max_seconds:
+            print(f"❌ {module} supera {args.max_seconds:.1f}s de import")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import asyncio
+from contextlib import nullcontext
+
+from config import UPLOAD_TO_FIREBASE, OUTBOX_MAX_ATTEMPTS
+from bot.sender import TelegramRateLimiter
+from bot.utils import send_jobs
+from utils.firestore_utils import (
+    enqueue_outbox,
+    get_pending_outbox,
+    get_sent_outbox_ids,
+    mark_outbox_sent,
+    record_outbox_failures,
+)
+
+
+class OutboxDispatcher:
+    """
+    Envía las notificaciones desacopladas del scraping.
+
+    `enqueue` guarda los jobs aceptados en el outbox de Firestore (colección
+    'outbox', un documento por ID de job) y los pasa a una tarea de fondo que
+    los envía a Telegram. Cada job se marca como enviado (`sent_at`) recién
+    cuando se envió, así que si el proceso muere o Telegram falla, los
+    pendientes se reenvían en la próxima ejecución (entrega at-least-once).
+
+    Un mismo ID se envía una sola vez: se saltean los que ya están marcados
+    en el outbox y los que ya se encolaron o enviaron en esta ejecución.
+    """
+
+    def __init__(self, bot, channel_id, durable=UPLOAD_TO_FIREBASE, report=None):
+        self.bot = bot
+        self.channel_id = channel_id
+        self.durable = durable
+        # RunReport opcional donde se registra cada envío
+        self.report = report
+        # Límites de Telegram compartidos por todos los envíos de la ejecución
+        self._rate_limiter = TelegramRateLimiter()
+        self._queue = asyncio.Queue()
+        self._task = None
+        # IDs encolados (incluye los pendientes del outbox) y enviados en esta ejecución
+        self._queued_ids = set()
+        self._sent_ids = set()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def enqueue(self, jobs):
+        """Persiste los jobs en el outbox y los deja listos para enviar."""
+        # Se reservan los IDs antes de cualquier await: dos lotes que llegan a
+        # la vez no pueden encolar el mismo job
+        jobs = self._claim(jobs)
+        if not jobs:
+            return
+        if self.durable:
+            sent_ids = await asyncio.to_thread(
+                get_sent_outbox_ids, [_job_id(job) for job in jobs]
+            )
+            if sent_ids:
+                print(
+                    f"⏭️ {len(sent_ids)} jobs ya se habían notificado; no se reenvían."
+                )
+                jobs = [job for job in jobs if _job_id(job) not in sent_ids]
+                if not jobs:
+                    return
+            await asyncio.to_thread(enqueue_outbox, jobs)
+        self._queue.put_nowait(jobs)
+
+    def _claim(self, jobs):
+        """Descarta los jobs cuyo ID ya se encoló en esta ejecución y reserva el resto."""
+        claimed = []
+        for job in jobs or ():
+            job_id = _job_id(job)
+            if job_id in self._queued_ids:
+                continue
+            self._queued_ids.add(job_id)
+            claimed.append(job)
+        return claimed
+
+    async def close(self):
+        """Espera a que se envíe todo lo encolado."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        # Pendientes de ejecuciones anteriores que no se llegaron a enviar. El
+        # scraping ya puede estar encolando: los lotes persistidos antes de
+        # esta lectura aparecen también acá y _claim los descarta
+        if self.durable:
+            pending = await asyncio.to_thread(get_pending_outbox, OUTBOX_MAX_ATTEMPTS)
+            pending = self._claim(pending)
+            if pending:
+                print(f"📬 Reenviando {len(pending)} jobs pendientes del outbox...")
+                await self._deliver(pending)
+
+        closed = False
+        while not closed:
+            jobs = await self._queue.get()
+            if jobs is None:
+                break
+            # Juntar los lotes que llegaron mientras se enviaba el anterior
+            while not self._queue.empty():
+                more_jobs = self._queue.get_nowait()
+                if more_jobs is None:
+                    closed = True
+                    break
+                jobs = jobs + more_jobs
+            await self._deliver(jobs)
+
+    async def _deliver(self, jobs):
+        jobs = [job for job in jobs if _job_id(job) not in self._sent_ids]
+        if not jobs:
+            return
+        measure = self.report.stage if self.report else _no_report
+        with measure("send", rows_in=len(jobs)) as stage:
+            try:
+                sent_ids = await send_jobs(
+                    self.bot,
+                    self.channel_id,
+                    jobs,
+                    on_sent=self._on_sent,
+                    rate_limiter=self._rate_limiter,
+                )
+            except Exception as e:
+                print(f"❌ Error al enviar jobs a Telegram: {e}")
+                sent_ids = set()
+            stage["rows_out"] = len(sent_ids)
+
+        failed_ids = {_job_id(job) for job in jobs} - sent_ids
+        if self.durable and failed_ids:
+            print(f"⚠️ {len(failed_ids)} jobs quedan en el outbox para reintentar.")
+            await asyncio.to_thread(record_outbox_failures, failed_ids)
+
+    async def _on_sent(self, message):
+        # Se marca como enviado apenas sale: si el proceso muere después, solo
+        # se repite lo que no llegó a confirmarse
+        _, _, job_ids = message
+        self._sent_ids.update(job_ids)
+        if self.durable:
+            await asyncio.to_thread(mark_outbox_sent, job_ids)
+
+
+def _job_id(job):
+    return str(job.get("id"))
+
+
+def _no_report(name, **rows):
+    return nullcontext({})
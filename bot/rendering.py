@@ -0,0 +1,176 @@
+import html
+import re
+
+# Límite de caracteres de un mensaje de Telegram
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+# Largo del extracto de la descripción en cada mensaje
+DESCRIPTION_PREVIEW_LENGTH = 200
+
+# Orden y título de los grupos del digest
+DIGEST_GROUP_TITLES = {
+    "excellent": "⭐ Excelentes",
+    "good": "👍 Buenos",
+    "review": "🔎 Para revisar",
+}
+
+_HTML_TAG_REGEX = re.compile(r"<[^>]+>")
+_WHITESPACE_REGEX = re.compile(r"\s+")
+
+# Caracteres finales de un prefijo limpio que pueden diferir del texto completo
+# (la entidad HTML con nombre más larga tiene 33 caracteres)
+_CUT_MARGIN = 40
+
+
+def clean_text(text, max_length=None):
+    """
+    Elimina HTML y exceso de espacios, y escapa el resultado para el
+    parse_mode HTML de Telegram. Con `max_length` solo limpia el prefijo
+    del texto que hace falta para obtener esa cantidad de caracteres.
+    """
+    if not isinstance(text, str):
+        # NaN de pandas u otros valores no texto
+        text = "" if text is None or text != text else str(text)
+    if not text:
+        return ""
+
+    if max_length is None:
+        return html.escape(_strip_html(text))
+
+    # Se limpia una ventana creciente del texto hasta cubrir max_length, con
+    # margen para lo que el corte puede alterar al final (espacios, entidades)
+    window = max_length * 2
+    while True:
+        if window >= len(text):
+            cleaned = _strip_html(text)
+            break
+        prefix = text[:window]
+        # No cortar una etiqueta por la mitad
+        tag_start = prefix.rfind("<")
+        if tag_start > prefix.rfind(">"):
+            prefix = prefix[:tag_start]
+        cleaned = _strip_html(prefix)
+        if len(cleaned) > max_length + _CUT_MARGIN:
+            break
+        window *= 2
+
+    return html.escape(cleaned[:max_length])
+
+
+def _strip_html(text):
+    text = _HTML_TAG_REGEX.sub("", text)
+    text = html.unescape(text)
+    return _WHITESPACE_REGEX.sub(" ", text).strip()
+
+
+def format_tags(tags):
+    """Keywords de los tags ({categoría: [keywords]}) separadas por coma, sin repetir."""
+    if isinstance(tags, dict):
+        keywords = [kw for group in tags.values() for kw in (group or [])]
+    else:
+        keywords = list(tags or [])
+    return clean_text(", ".join(dict.fromkeys(str(kw) for kw in keywords)))
+
+
+def render_job_message(job):
+    """Mensaje HTML completo de un job."""
+    description = clean_text(
+        job.get("description", ""), max_length=DESCRIPTION_PREVIEW_LENGTH
+    )
+    url = html.escape(_strip_html(str(job.get("url") or "#")), quote=True)
+    return (
+        f"💼 <b>{clean_text(job.get('title', 'N/A'))}</b> ({clean_text(job.get('modality', 'N/A'))})\n"
+        f"--- \n"
+        f"🏢 Empresa: {clean_text(job.get('company', 'N/A'))}\n"
+        f"💰 Salario: {clean_text(job.get('salary', 'No especificado'))}\n"
+        f"🏷️ Tags: <code>{format_tags(job.get('tags'))}</code>\n\n"
+        f"🆔 ID: <code>{clean_text(job.get('id', 'N/A'))}</code>\n"
+        f"🏢 Fuente: {clean_text(job.get('source', 'N/A'))}\n"
+        f"📝 Descripción:\n"
+        f"{description}...\n\n"
+        f"🔗 <a href='{url}'>Ver detalles</a>"
+    )
+
+
+def render_digest_entry(job):
+    """Versión compacta de un job para el digest."""
+    url = html.escape(_strip_html(str(job.get("url") or "#")), quote=True)
+    return (
+        f"💼 <b>{clean_text(job.get('title', 'N/A'))}</b> ({clean_text(job.get('modality', 'N/A'))})\n"
+        f"🏢 {clean_text(job.get('company', 'N/A'))} · {clean_text(job.get('source', 'N/A'))}\n"
+        f"🏷️ <code>{format_tags(job.get('tags'))}</code>\n"
+        f"🔗 <a href='{url}'>Ver detalles</a>\n"
+    )
+
+
+def build_job_messages(jobs):
+    """
+    Renderiza todos los mensajes antes de empezar a enviar:
+    un mensaje por job, [(etiqueta, texto, [id del job])].
+    """
+    return [
+        (job.get("title", "N/A"), render_job_message(job), [str(job.get("id"))])
+        for job in jobs
+    ]
+
+
+def build_digest_messages(jobs, group_by="quality_tier"):
+    """
+    Agrupa los jobs (por `quality_tier` o `source`) y los empaqueta en la menor
+    cantidad de mensajes posible sin pasar el límite de Telegram.
+    Devuelve [(etiqueta, texto, ids de los jobs del mensaje)].
+    """
+    groups = {}
+    for job in jobs:
+        groups.setdefault(_digest_group(job, group_by), []).append(job)
+
+    ordered_keys = [key for key in DIGEST_GROUP_TITLES if key in groups]
+    ordered_keys += [key for key in groups if key not in DIGEST_GROUP_TITLES]
+
+    messages = []
+    current_text, current_ids = "", []
+
+    for key in ordered_keys:
+        group_jobs = groups[key]
+        title = DIGEST_GROUP_TITLES.get(key, clean_text(str(key)))
+        header = f"<b>{title}</b> ({len(group_jobs)})\n\n"
+
+        for index, job in enumerate(group_jobs):
+            entry = render_digest_entry(job)
+            if index == 0:
+                entry = header + entry
+            candidate = f"{current_text}\n{entry}" if current_text else entry
+
+            if (
+                current_text
+                and _message_length(candidate) > TELEGRAM_MAX_MESSAGE_LENGTH
+            ):
+                messages.append(_digest_message(current_text, current_ids))
+                current_text, current_ids = "", []
+                # Si el grupo continúa en un mensaje nuevo, se repite el título
+                candidate = entry if index == 0 else header + entry
+
+            current_text = candidate
+            current_ids.append(str(job.get("id")))
+
+    if current_text:
+        messages.append(_digest_message(current_text, current_ids))
+    return messages
+
+
+def _digest_message(text, job_ids):
+    return (f"digest ({len(job_ids)} jobs)", text, job_ids)
+
+
+def _digest_group(job, group_by):
+    if group_by == "quality_tier":
+        score_details = job.get("score_details")
+        if isinstance(score_details, dict):
+            return score_details.get("quality_tier", "unknown")
+        return "unknown"
+    return job.get(group_by) or "unknown"
+
+
+def _message_length(text):
+    """Longitud como la cuenta Telegram (unidades UTF-16, incluye las etiquetas HTML)."""
+    return len(text.encode("utf-16-le")) // 2
@@ -0,0 +1,170 @@
+import asyncio
+import time
+from collections import deque
+from datetime import timedelta
+
+from config import (
+    TELEGRAM_GROUP_MESSAGES_PER_MINUTE,
+    TELEGRAM_PRIVATE_MESSAGES_PER_MINUTE,
+    TELEGRAM_CHAT_BURST,
+    TELEGRAM_GLOBAL_MESSAGES_PER_SECOND,
+    TELEGRAM_SEND_CONCURRENCY,
+    TELEGRAM_MAX_RETRIES,
+)
+
+
+class TokenBucket:
+    """
+    Rate limiter async: `rate` mensajes por segundo con ráfagas de hasta
+    `capacity`. Los que esperan se atienden en orden de llegada.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds):
+        """Frena el bucket `seconds` segundos y lo vacía (ej: RetryAfter de Telegram)."""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0
+        self._updated = max(self._updated, self._paused_until)
+
+
+class TelegramRateLimiter:
+    """
+    Buckets por chat y global del bot. Quien envía varios lotes en la misma
+    ejecución (ej: OutboxDispatcher) crea uno y lo reutiliza; no se guardan a
+    nivel módulo porque el asyncio.Lock de cada bucket queda atado al event
+    loop que lo usa primero y otro asyncio.run en el mismo proceso fallaría.
+    """
+
+    def __init__(self):
+        self._chat_buckets = {}
+        self.global_bucket = TokenBucket(
+            TELEGRAM_GLOBAL_MESSAGES_PER_SECOND, TELEGRAM_GLOBAL_MESSAGES_PER_SECOND
+        )
+
+    def chat_bucket(self, chat_id):
+        if chat_id not in self._chat_buckets:
+            self._chat_buckets[chat_id] = TokenBucket(
+                _chat_messages_per_minute(chat_id) / 60, TELEGRAM_CHAT_BURST
+            )
+        return self._chat_buckets[chat_id]
+
+
+def _chat_messages_per_minute(chat_id):
+    """Grupos y canales (ID negativo o @nombre) admiten menos mensajes que un chat privado."""
+    if str(chat_id).strip().startswith(("-", "@")):
+        return TELEGRAM_GROUP_MESSAGES_PER_MINUTE
+    return TELEGRAM_PRIVATE_MESSAGES_PER_MINUTE
+
+
+def _seconds(retry_after):
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+async def send_messages(bot, chat_id, messages, on_sent=None, rate_limiter=None):
+    """
+    Envía mensajes HTML a un chat al ritmo máximo que permite Telegram.
+
+    Args:
+        messages: lista de (etiqueta para logs, texto, ids de los jobs que incluye).
+        on_sent: corrutina opcional que se llama con cada mensaje apenas se envía.
+        rate_limiter: TelegramRateLimiter a compartir entre llamadas; si no se
+            pasa, se usa uno nuevo para esta llamada.
+
+    Respeta los límites por chat y global con token buckets; ante un
+    RetryAfter frena el chat el tiempo pedido y vuelve a encolar el mensaje
+    (sin contarlo como intento). Los errores transitorios se reintentan hasta
+    TELEGRAM_MAX_RETRIES veces.
+    Devuelve los mensajes enviados.
+    """
+    queue = deque((message, 0) for message in messages)
+    if not queue:
+        return []
+
+    # telegram se importa recién al enviar: el resto del pipeline no lo necesita
+    from telegram import constants
+    from telegram.error import BadRequest, Forbidden, RetryAfter
+
+    rate_limiter = rate_limiter or TelegramRateLimiter()
+    chat_bucket = rate_limiter.chat_bucket(chat_id)
+    global_bucket = rate_limiter.global_bucket
+    sent_messages = []
+    start = time.monotonic()
+
+    async def worker():
+        while queue:
+            message, attempts = queue.popleft()
+            label, text, _ = message
+            await chat_bucket.acquire()
+            await global_bucket.acquire()
+
+            try:
+                await bot.send_message(
+                    chat_id=chat_id,
+                    text=text,
+                    parse_mode=constants.ParseMode.HTML,
+                    disable_web_page_preview=True,
+                )
+            except RetryAfter as e:
+                wait = _seconds(e.retry_after)
+                print(
+                    f"⏳ Telegram pidió esperar {wait:.0f}s antes de seguir enviando."
+                )
+                chat_bucket.pause(wait)
+                # No es un error del mensaje: vuelve al frente sin gastar un reintento
+                queue.appendleft((message, attempts))
+                continue
+            except (BadRequest, Forbidden) as e:
+                # Errores permanentes (mensaje inválido, sin permisos): no se reintentan
+                print(f"No se pudo enviar '{label}' a {chat_id}: {e}")
+                continue
+            except Exception as e:
+                _requeue(queue, message, attempts + 1, chat_id, e)
+                continue
+
+            sent_messages.append(message)
+            if on_sent:
+                await on_sent(message)
+
+    workers = min(TELEGRAM_SEND_CONCURRENCY, len(queue))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    elapsed = time.monotonic() - start
+    print(
+        f"📨 {len(sent_messages)}/{len(messages)} mensajes enviados a Telegram en {elapsed:.1f}s."
+    )
+    return sent_messages
+
+
+def _requeue(queue, message, attempts, chat_id, error):
+    """Vuelve a encolar un mensaje fallido si le quedan reintentos."""
+    if attempts > TELEGRAM_MAX_RETRIES:
+        print(f"No se pudo enviar '{message[0]}' a {chat_id}: {error}")
+        return
+    queue.append((message, attempts))
@@ -1,41 +1,29 @@
-import asyncio
-import re
-from telegram import constants
+from config import TELEGRAM_DIGEST_MODE, TELEGRAM_DIGEST_GROUP_BY
+from bot.rendering import build_digest_messages, build_job_messages
+from bot.sender import send_messages
 
 
-async def send_jobs(bot, channel_id, jobs):
-    for job in jobs:
-        tags_display = ", ".join(job.get("tags", []))
+async def send_jobs(
+    bot,
+    channel_id,
+    jobs,
+    digest=TELEGRAM_DIGEST_MODE,
+    on_sent=None,
+    rate_limiter=None,
+):
+    """
+    Envía los jobs aceptados al canal: un mensaje por job o, en modo digest,
+    varios jobs por mensaje agrupados por TELEGRAM_DIGEST_GROUP_BY.
+    Todos los mensajes se renderizan antes de empezar a enviar.
+    `rate_limiter` (opcional) se comparte entre envíos, ver send_messages.
+    Devuelve el set de IDs de los jobs enviados.
+    """
+    if digest:
+        messages = build_digest_messages(jobs, TELEGRAM_DIGEST_GROUP_BY)
+    else:
+        messages = build_job_messages(jobs)
 
-        text = (
-            f"💼 <b>{clean_text(job.get('title', 'N/A'))}</b> ({clean_text(job.get('modality', 'N/A'))})\n"
-            f"--- \n"
-            f"🏢 Empresa: {clean_text(job.get('company', 'N/A'))}\n"
-            f"💰 Salario: {clean_text(job.get('salary', 'No especificado'))}\n"
-            f"🏷️ Tags: <code>{tags_display}</code>\n\n"
-            f"🆔 ID: <code>{job.get('id', 'N/A')}</code>\n"
-            f"🏢 Fuente: {clean_text(job.get('source', 'N/A'))}\n"
-            f"📝 Descripción:\n"
-            f"{clean_text(job.get('description', ''))[:200]}...\n\n"
-            f"🔗 <a href='{clean_text(job.get('url', '#'))}'>Ver detalles</a>"
-        )
-
-        try:
-            await bot.send_message(
-                chat_id=channel_id,
-                text=text,
-                parse_mode=constants.ParseMode.HTML,
-                disable_web_page_preview=True,
-            )
-            await asyncio.sleep(1.0)
-        except Exception as e:
-            print(f"No se pudo enviar '{job['title']}' a {channel_id}: {e}")
-
-
-def clean_text(text):
-    """Elimina HTML y exceso de espacios."""
-    if not text:
-        return ""
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    sent_messages = await send_messages(
+        bot, channel_id, messages, on_sent=on_sent, rate_limiter=rate_limiter
+    )
+    return {job_id for _, _, job_ids in sent_messages for job_id in job_ids}
@@ -0,0 +1,15 @@
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from utils.cleanup_utils import run_cleanup
+
+
+def main():
+    # Limpieza de retención como proceso aparte (ej: un workflow diario),
+    # útil con CLEANUP_DURING_SCRAPE = False en config.py
+    run_cleanup()
+
+
+if __name__ == "__main__":
+    main()
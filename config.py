@@ -8,6 +8,89 @@ DAYS_OLD_THRESHOLD = 1
 
 JOBSPY_HOURS_OLD = 11
 
+# Cache HTTP en disco de los fetchers (se conserva entre ejecuciones con actions/cache)
+HTTP_CACHE_DIR = ".cache/http"
+
+HTTP_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+# Strings de fecha distintos que se recuerdan ya parseados (LRU en memoria)
+DATE_PARSE_CACHE_SIZE = 4096
+
+# Reporte de cada ejecución: tiempo, CPU, pico de memoria y filas por etapa
+RUN_REPORT_FILE = ".cache/run_report.json"
+
+# Watermarks por fuente (último published_at visto): solo se procesan avisos más nuevos
+WATERMARKS_FILE = ".cache/watermarks.json"
+
+# Margen hacia atrás del watermark: fuentes que indexan tarde o retrofechan
+# avisos (LinkedIn, JobSpy) pueden traer jobs nuevos con published_at anterior
+# al watermark. Los ya guardados dentro del margen los descarta get_new_jobs.
+WATERMARK_LOOKBACK_HOURS = 48
+
+# Respaldar los watermarks en Firestore (documento state/watermarks)
+WATERMARKS_FIRESTORE_BACKUP = False
+
+# Índice local de IDs ya guardados en Firestore (evita consultarlos de nuevo).
+# Vive en .cache para conservarse entre ejecuciones de GitHub Actions.
+SEEN_IDS_DB = ".cache/seen_ids.sqlite"
+
+# Análisis y scoring en varios procesos para lotes grandes (backfills,
+# re-scoring) que llegan sin análisis de texto: se activa desde esta cantidad de
+# jobs y con más de un core. Con SCORING_PROCESSES = None usa todos los cores.
+# Levantar el pool cuesta ~1s: con 2 cores compensa desde ~15k jobs
+# (ver benchmarks/parallel_scoring.py)
+SCORING_PARALLEL_MIN_ROWS = 15000
+SCORING_PROCESSES = None
+
+# Operaciones de Firestore en paralelo (consultas y escrituras por lotes)
+FIRESTORE_MAX_CONCURRENCY = 8
+
+# Reintentos (con backoff exponencial) de cada lote que falla en Firestore
+FIRESTORE_MAX_RETRIES = 3
+
+# Tamaño máximo de cada lote de escritura (Firestore admite 500 escrituras y
+# ~10 MiB por request; se deja margen para la estimación del payload)
+FIRESTORE_MAX_BATCH_WRITES = 500
+FIRESTORE_MAX_BATCH_BYTES = 9 * 1024 * 1024
+
+# Además del documento mensual trends/{YYYY_MM}, guardar un documento por día
+# en la colección trends_daily (se limpia con la misma retención que los jobs)
+TRENDS_DAILY_BUCKETS = False
+
+# Limpieza de documentos antiguos: corre en paralelo al scraping y se corta al
+# agotar el presupuesto de tiempo (lo que quede se borra en la próxima ejecución).
+# Con CLEANUP_DURING_SCRAPE = False solo corre con `python cleanup.py`.
+CLEANUP_DURING_SCRAPE = True
+CLEANUP_TIME_BUDGET_SECONDS = 60
+
+# Límites de envío a Telegram (token buckets), según el tipo de chat: ~20 mensajes
+# por minuto en un grupo/canal (TELEGRAM_CHANNEL_ID suele ser un canal) y ~1 por
+# segundo en un chat privado; ~30 por segundo para todo el bot. Pasarlos solo
+# trae RetryAfter. Para muchos jobs en un canal conviene TELEGRAM_DIGEST_MODE.
+TELEGRAM_GROUP_MESSAGES_PER_MINUTE = 20
+TELEGRAM_PRIVATE_MESSAGES_PER_MINUTE = 60
+TELEGRAM_CHAT_BURST = 3
+TELEGRAM_GLOBAL_MESSAGES_PER_SECOND = 30
+TELEGRAM_SEND_CONCURRENCY = 3
+TELEGRAM_MAX_RETRIES = 3
+
+# Modo digest: varios jobs por mensaje (hasta 4096 caracteres), agrupados por
+# "quality_tier" o "source", en lugar de un mensaje por job
+TELEGRAM_DIGEST_MODE = False
+TELEGRAM_DIGEST_GROUP_BY = "quality_tier"
+
+# Outbox de notificaciones (colección 'outbox' en Firestore): un job que falla
+# se reintenta en las próximas ejecuciones hasta este número de veces
+OUTBOX_MAX_ATTEMPTS = 5
+
+# Revalidación del sitio (ISR de Next.js): las rutas pedidas dentro de esta
+# ventana se juntan y se revalidan una sola vez
+REVALIDATION_DEBOUNCE_SECONDS = 5
+REVALIDATION_MAX_RETRIES = 3
+# Enviar todas las rutas en un solo request (?path=/&path=/archive); solo si el
+# endpoint del frontend lee todos los `path` de la query
+REVALIDATION_BATCH_PATHS = False
+
 JOBSPY_SEARCH_TERMS = (
     '(junior OR jr OR trainee OR "entry level" OR pasante OR intern) '
     "AND "
@@ -17,9 +100,15 @@ JOBSPY_SEARCH_TERMS = (
 FETCHER_CONFIG = {
     "GetOnBoardFetcher": {
         "base_url": "https://www.getonbrd.com/api/v0/categories/{category}/jobs",
-        "per_page": 5,
+        "per_page": 20,
         "page": 1,
+        # Se siguen las páginas hasta llegar a avisos más viejos que DAYS_OLD_THRESHOLD
+        "max_pages": 10,
+        # Categorías consultadas en paralelo (comparten una sesión keep-alive)
+        "max_concurrency": 4,
         "timeout": 15,
+        # Segundos durante los que una página cacheada se usa sin revalidar
+        "cache_ttl": 30 * 60,
         "seniority_ids": [1, 2],
         "categories": [
             "programacion",
@@ -44,5 +133,6 @@ FETCHER_CONFIG = {
     "EducacionITFetcher": {
         "base_url": "https://empleos.educacionit.com/trabajos?nivel=junior",
         "timeout": 15,
+        "cache_ttl": 60 * 60,
     },
 }
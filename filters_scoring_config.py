@@ -453,6 +453,41 @@ TAGS_KEYWORDS = {
     ],
 }
 
+# Modalidad de trabajo. Cada espacio admite cualquier cantidad de espacios o
+# saltos de línea (incluso ninguno): "desde casa" también detecta "desde\ncasa"
+MODALITY_TERMS = {
+    "on_site_only": [
+        "100% on-site",
+        "100% onsite",
+        "100% presencial",
+        "exclusivamente presencial",
+    ],
+    "remote": [
+        "remoto",
+        "remote",
+        "desde casa",
+        "work from home",
+        "wfh",
+        "teletrabajo",
+        "anywhere",
+    ],
+    "on_site": [
+        "presencial",
+        "on-site",
+        "onsite",
+        "oficina",
+        "sede",
+        "caba",
+        "buenos aires",
+        "viajes",
+    ],
+    "hybrid": [
+        "híbrido",
+        "hybrid",
+        "mixto",
+    ],
+}
+
 WEAK_IT_SIGNALS = {
     "tech",
     "technology",
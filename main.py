@@ -4,12 +4,11 @@ load_dotenv()
 
 import os
 import asyncio
-from telegram import Bot as TelegramBot
 from sources.getonboard_fetcher import fetch_getonboard
 from sources.educacionit_fetcher import fetch_educacionit
 from sources.jobspy_fetcher import fetch_jobspy
 from utils.scraping_utils import scrape
-
+from utils.watermark_utils import commit_watermarks
 
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 CHANNEL_ID = os.getenv("TELEGRAM_CHANNEL_ID")
@@ -23,8 +22,14 @@ def main():
             "⚠️ No se encontró el ID del canal en la variable de entorno TELEGRAM_CHANNEL_ID. El bot no podrá enviar notificaciones."
         )
 
+    from telegram import Bot as TelegramBot
+
     bot = TelegramBot(BOT_TOKEN)
-    asyncio.run(scrape(SOURCES, CHANNEL_ID, bot))
+    completed_sources = asyncio.run(scrape(SOURCES, CHANNEL_ID, bot))
+
+    # Los watermarks solo avanzan si la ejecución terminó sin errores y para
+    # las fuentes cuyos jobs se guardaron completos en Firestore
+    commit_watermarks(completed_sources)
 
 
 if __name__ == "__main__":
@@ -3,19 +3,33 @@ from datetime import datetime
 import requests
 from bs4 import BeautifulSoup
 from config import FETCHER_CONFIG
+from sources.http_cache import HttpCache
+from utils.watermark_utils import filter_jobs_after_watermark
 
 
 def fetch_educacionit():
     config = FETCHER_CONFIG.get("EducacionITFetcher", {})
+    cache = HttpCache("educacionit", config.get("cache_ttl", 0))
 
-    all_jobs = []
+    # Si la página no cambió se reutilizan los jobs ya parseados
     try:
-        req = requests.get(config.get("base_url"), timeout=config.get("timeout", 15))
-        req.raise_for_status()
+        all_jobs = cache.fetch(
+            requests,
+            config.get("base_url"),
+            _parse_jobs,
+            timeout=config.get("timeout", 15),
+        )
     except requests.RequestException as e:
         print(f"Error fetching EducaciónIT: {e}")
-        return all_jobs
+        return []
+    finally:
+        cache.report()
+
+    return filter_jobs_after_watermark("educacionit", all_jobs)
 
+
+def _parse_jobs(req):
+    all_jobs = []
     soup = BeautifulSoup(req.text, "html.parser")
     job_cards = soup.select("div.itemEmpleo")
 
@@ -1,76 +1,164 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta, timezone
+
 import requests
-from config import FETCHER_CONFIG
+from requests.adapters import HTTPAdapter
+from config import DAYS_OLD_THRESHOLD, FETCHER_CONFIG
+from sources.http_cache import HttpCache
+from utils.watermark_utils import filter_jobs_after_watermark, get_watermark_cutoff
 
 
 def fetch_getonboard():
     config = FETCHER_CONFIG.get("GetOnBoardFetcher", {})
+    categories = config.get("categories", [])
 
     all_jobs = []
-    for category in config.get("categories", []):
+    if not categories:
+        return all_jobs
+
+    # Se pagina hasta el watermark menos su margen (o DAYS_OLD_THRESHOLD si es más reciente)
+    cutoff_ts = _get_cutoff_timestamp()
+    watermark_cutoff = get_watermark_cutoff("getonboard")
+    if watermark_cutoff is not None:
+        cutoff_ts = max(cutoff_ts, watermark_cutoff)
+    cache = HttpCache("getonboard", config.get("cache_ttl", 0))
+    max_concurrency = max(1, min(config.get("max_concurrency", 4), len(categories)))
+
+    # Una sola sesión keep-alive compartida por todas las categorías
+    with requests.Session() as session:
+        session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        )
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            results = executor.map(
+                lambda category: _fetch_category(
+                    session, cache, config, category, cutoff_ts
+                ),
+                categories,
+            )
+            for category_jobs in results:
+                all_jobs.extend(category_jobs)
+
+    cache.report()
+    return filter_jobs_after_watermark("getonboard", all_jobs)
+
+
+def _get_cutoff_timestamp():
+    """Timestamp (UTC) desde el que un aviso sigue siendo reciente según DAYS_OLD_THRESHOLD."""
+    cutoff_date = datetime.now(timezone.utc).date() - timedelta(days=DAYS_OLD_THRESHOLD)
+    return datetime.combine(cutoff_date, time.min, tzinfo=timezone.utc).timestamp()
+
+
+def _fetch_category(session, cache, config, category, cutoff_ts):
+    """Recorre las páginas de una categoría hasta encontrar avisos viejos."""
+    category_jobs = []
+    page = config.get("page", 1)
+    max_pages = config.get("max_pages", 1)
+
+    for _ in range(max_pages):
         try:
-            req = requests.get(
+            # Las páginas que no cambiaron salen de la cache ya parseadas
+            parsed_page = cache.fetch(
+                session,
                 config.get("base_url").format(category=category),
+                lambda req: _parse_page(req, config),
                 params={
                     "per_page": config.get("per_page", 10),
-                    "page": config.get("page", 1),
+                    "page": page,
                     "expand": '["company"]',
                 },
                 timeout=config.get("timeout", 15),
             )
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching GetOnBoard ({category}, page {page}): {e}")
+            break
+
+        category_jobs.extend(parsed_page["jobs"])
+
+        # Cortar si la página está vacía, es la última o ya trae avisos viejos
+        published_timestamps = parsed_page["published_timestamps"]
+        total_pages = parsed_page["total_pages"]
+        if (
+            not parsed_page["size"]
+            or (total_pages is not None and page >= total_pages)
+            or (published_timestamps and min(published_timestamps) < cutoff_ts)
+        ):
+            break
+
+        page += 1
+
+    return category_jobs
+
+
+def _parse_page(req, config):
+    """Normaliza una página de la API (resultado serializable para la cache HTTP)."""
+    response = req.json()
+    data = response.get("data", [])
+
+    jobs = []
+    for job in data:
+        normalized_job = _normalize_job(job, config)
+        if normalized_job:
+            jobs.append(normalized_job)
+
+    published_timestamps = [
+        job.get("attributes", {}).get("published_at") for job in data
+    ]
+    return {
+        "jobs": jobs,
+        "size": len(data),
+        "published_timestamps": [
+            ts for ts in published_timestamps if isinstance(ts, (int, float))
+        ],
+        "total_pages": response.get("meta", {}).get("total_pages"),
+    }
+
+
+def _normalize_job(job, config):
+    try:
+        jobData = job.get("attributes", {})
+        job_id = f"getonboard-{job.get('id', '').strip()}"
+
+        published_at_ts = jobData.get("published_at")
+        published_at = published_at_ts
+
+        # Extraer seniority y filtrar solo Trainee y Junior
+        seniority_id = jobData.get("seniority", {}).get("data", {}).get("id")
+        if seniority_id not in config.get("seniority_ids", []):
+            return None
+
+        if jobData.get("remote") is False:
+            return None
+
+        if jobData.get("remote_modality") not in ["fully_remote"]:
+            return None
+
+        salary_min = jobData.get("min_salary")
+        salary_max = jobData.get("max_salary")
+
+        if salary_min and salary_max:
+            salary = f"${salary_min} - ${salary_max}"
+        elif salary_min:
+            salary = f"Mínimo ${salary_min}"
+        elif salary_max:
+            salary = f"Máximo ${salary_max}"
+        else:
+            salary = "No especificado"
 
-            req.raise_for_status()
-            data = req.json().get("data", [])
-        except requests.RequestException as e:
-            print(f"Error fetching GetOnBoard ({category}): {e}")
-            continue
-
-        for job in data:
-            try:
-                jobData = job.get("attributes", {})
-                job_id = f"getonboard-{job.get('id', '').strip()}"
-
-                published_at_ts = jobData.get("published_at")
-                published_at = published_at_ts
-
-                # Extraer seniority y filtrar solo Trainee y Junior
-                seniority_id = jobData.get("seniority", {}).get("data", {}).get("id")
-                if seniority_id not in config.get("seniority_ids", []):
-                    continue
-
-                if jobData.get("remote") is False:
-                    continue
-
-                if jobData.get("remote_modality") not in ["fully_remote"]:
-                    continue
-
-                salary_min = jobData.get("min_salary")
-                salary_max = jobData.get("max_salary")
-
-                if salary_min and salary_max:
-                    salary = f"${salary_min} - ${salary_max}"
-                elif salary_min:
-                    salary = f"Mínimo ${salary_min}"
-                elif salary_max:
-                    salary = f"Máximo ${salary_max}"
-                else:
-                    salary = "No especificado"
-
-                all_jobs.append(
-                    {
-                        "id": job_id,
-                        "title": jobData.get("title", ""),
-                        "company": jobData.get("company", {})
-                        .get("data", {})
-                        .get("attributes", {})
-                        .get("name", ""),
-                        "description": jobData.get("description", ""),
-                        "source": "GetOnBoard",
-                        "salary": salary,
-                        "url": job.get("links", {}).get("public_url", ""),
-                        "published_at": published_at,
-                    }
-                )
-            except Exception as e:
-                print(f"⚠️ Error normalizing job from Getonboard: {e}")
-                continue
-    return all_jobs
+        return {
+            "id": job_id,
+            "title": jobData.get("title", ""),
+            "company": jobData.get("company", {})
+            .get("data", {})
+            .get("attributes", {})
+            .get("name", ""),
+            "description": jobData.get("description", ""),
+            "source": "GetOnBoard",
+            "salary": salary,
+            "url": job.get("links", {}).get("public_url", ""),
+            "published_at": published_at,
+        }
+    except Exception as e:
+        print(f"⚠️ Error normalizing job from Getonboard: {e}")
+        return None
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from config import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES
+
+
+class HttpCache:
+    """
+    Cache HTTP en disco para los fetchers.
+
+    Guarda por URL el ETag/Last-Modified y el resultado ya parseado de la página.
+    - Dentro del TTL: devuelve el resultado guardado sin ir a la red.
+    - Vencido: revalida con If-None-Match / If-Modified-Since; si el servidor
+      responde 304 se reutiliza el resultado sin volver a parsear.
+    - El directorio tiene un tamaño máximo; se borran las entradas usadas hace más tiempo.
+    """
+
+    def __init__(
+        self, namespace, ttl, cache_dir=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, session, url, parse, params=None, timeout=15):
+        """
+        Descarga `url` (o la toma de la cache) y devuelve `parse(response)`.
+        `session` puede ser una requests.Session o el módulo requests.
+        El resultado de `parse` tiene que poder serializarse a JSON.
+        """
+        path = self._entry_path(url, params)
+        entry = self._load(path)
+
+        if entry and time.time() - entry.get("fetched_at", 0) < self.ttl:
+            self._count("hits")
+            self._touch(path)
+            return entry["parsed"]
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            self._count("revalidated")
+            entry["fetched_at"] = time.time()
+            self._save(path, entry)
+            return entry["parsed"]
+
+        response.raise_for_status()
+        parsed = parse(response)
+        self._count("misses")
+
+        self._save(
+            path,
+            {
+                "url": url,
+                "params": params,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "parsed": parsed,
+            },
+        )
+        self._evict()
+        return parsed
+
+    def report(self):
+        """Imprime los hits/misses de la cache de esta fuente."""
+        print(
+            f"🗄️ Cache HTTP {self.namespace}: {self.hits + self.revalidated} hits "
+            f"({self.revalidated} revalidados con 304), {self.misses} misses"
+        )
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _entry_path(self, url, params):
+        raw_key = json.dumps([url, params], sort_keys=True, default=str)
+        digest = hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{self.namespace}-{digest}.json")
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _save(self, path, entry):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ No se pudo guardar en la cache HTTP ({self.namespace}): {e}")
+
+    def _evict(self):
+        """Borra las entradas menos usadas (por mtime) hasta quedar bajo max_bytes."""
+        with self._lock:
+            try:
+                entries = []
+                for name in os.listdir(self.cache_dir):
+                    if not name.endswith(".json"):
+                        continue
+                    entry_path = os.path.join(self.cache_dir, name)
+                    stat = os.stat(entry_path)
+                    entries.append((stat.st_mtime, stat.st_size, entry_path))
+            except OSError:
+                return
+
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, entry_path in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                try:
+                    os.remove(entry_path)
+                    total_bytes -= size
+                except OSError:
+                    continue
@@ -1,5 +1,8 @@
-from jobspy import scrape_jobs
-from config import FETCHER_CONFIG
+import math
+from datetime import datetime, timezone
+
+from config import FETCHER_CONFIG, WATERMARK_LOOKBACK_HOURS
+from utils.watermark_utils import filter_jobs_after_watermark, get_watermark
 
 
 def fetch_jobspy():
@@ -8,13 +11,16 @@ def fetch_jobspy():
     all_jobs = []
 
     try:
+        # jobspy (y sus dependencias) se importa solo si la fuente se ejecuta
+        from jobspy import scrape_jobs
+
         df = scrape_jobs(
             site_name=config.get("site_name", []),
             search_term=config.get("search_terms"),
             location=config.get("location"),
             country_indeed=config.get("country_indeed"),
             results_wanted=config.get("results_wanted"),
-            hours_old=config.get("hours_old"),
+            hours_old=_get_hours_old(config.get("hours_old")),
             linkedin_fetch_description=config.get("linkedin_fetch_description", False),
         )
     except Exception as e:
@@ -44,4 +50,17 @@ def fetch_jobspy():
         except Exception as e:
             print(f"⚠️ Error normalizing job from Jobspy: {e}")
             continue
-    return all_jobs
+    return filter_jobs_after_watermark("jobspy", all_jobs)
+
+
+def _get_hours_old(max_hours_old):
+    """Ventana de búsqueda: desde la última ejecución exitosa, sin pasar de max_hours_old."""
+    watermark = get_watermark("jobspy")
+    if not max_hours_old or not watermark or not watermark.get("fetched_at"):
+        return max_hours_old
+
+    elapsed = datetime.now(timezone.utc).timestamp() - watermark["fetched_at"]
+    # Margen para no perder avisos publicados durante la ejecución anterior ni
+    # los que la fuente indexa tarde con fecha de publicación más vieja
+    hours_since_last_run = math.ceil(elapsed / 3600) + max(1, WATERMARK_LOOKBACK_HOURS)
+    return max(1, min(max_hours_old, hours_since_last_run))
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import (
+    ACCEPTED_JOBS_RETENTION_DAYS,
+    REJECTED_JOBS_RETENTION_DAYS,
+    TRENDS_DAILY_BUCKETS,
+    CLEANUP_TIME_BUDGET_SECONDS,
+)
+from utils.firestore_utils import delete_old_documents, delete_old_trends
+
+
+def get_cleanup_tasks():
+    """Purgas de retención a ejecutar: (nombre, función, argumentos)."""
+    tasks = [
+        # Jobs aceptados antiguos
+        (
+            "jobs accepted",
+            delete_old_documents,
+            ("jobs", ACCEPTED_JOBS_RETENTION_DAYS, "accepted"),
+        ),
+        # Jobs rechazados antiguos (con mayor frecuencia)
+        (
+            "jobs rejected",
+            delete_old_documents,
+            ("jobs", REJECTED_JOBS_RETENTION_DAYS, "rejected"),
+        ),
+        ("trends", delete_old_trends, (ACCEPTED_JOBS_RETENTION_DAYS, "trends")),
+        # Notificaciones que agotaron sus reintentos
+        ("outbox", delete_old_documents, ("outbox", ACCEPTED_JOBS_RETENTION_DAYS)),
+    ]
+    if TRENDS_DAILY_BUCKETS:
+        tasks.append(
+            (
+                "trends_daily",
+                delete_old_trends,
+                (ACCEPTED_JOBS_RETENTION_DAYS, "trends_daily"),
+            )
+        )
+    return tasks
+
+
+def run_cleanup(time_budget=CLEANUP_TIME_BUDGET_SECONDS):
+    """
+    Ejecuta todas las purgas de retención en paralelo (un thread por colección)
+    y se detiene al agotar `time_budget` segundos.
+
+    Returns:
+        dict {nombre de la purga: documentos eliminados}.
+    """
+    start = time.monotonic()
+    deadline = start + time_budget if time_budget else None
+    tasks = get_cleanup_tasks()
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            name: executor.submit(func, *args, deadline=deadline)
+            for name, func, args in tasks
+        }
+        deleted = {name: future.result() for name, future in futures.items()}
+
+    elapsed = time.monotonic() - start
+    summary = ", ".join(f"{name}: {count}" for name, count in deleted.items())
+    print(
+        f"🧹 Limpieza terminada en {elapsed:.1f}s: "
+        f"{sum(deleted.values())} documentos eliminados ({summary})."
+    )
+    return deleted
+
+
+async def run_cleanup_async(time_budget=CLEANUP_TIME_BUDGET_SECONDS):
+    """`run_cleanup` fuera del event loop, para correrla junto al scraping."""
+    return await asyncio.to_thread(run_cleanup, time_budget)
@@ -8,49 +8,70 @@ from filters_scoring_config import (
     WEAK_IT_SIGNALS,
     STRONG_ROLE_SIGNALS,
     STRONG_TECH_SIGNALS,
+    SENIOR_EXPERIENCE_PATTERNS,
+    TAGS_KEYWORDS,
+    MODALITY_TERMS,
 )
+from utils.term_scanner import TermScanner
 
 print("🔄 Compiling regex patterns from config...")
 
-_REGEX_AREA_PREFILTER = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in EXCLUDED_AREA_TERMS_TITLE),
-    re.IGNORECASE | re.UNICODE,
-)
-
-_REGEX_SENIORITY_EXCLUDED = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in EXCLUDED_SENIORITYS),
-    re.IGNORECASE | re.UNICODE,
-)
-
-_REGEX_POSITIVE_SENIORITY = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in POSITIVE_SENIORITY_TERMS),
-    re.IGNORECASE | re.UNICODE,
-)
+# Escáner de una sola pasada con todos los términos de la config. Cada job se
+# escanea una vez (ver utils.text_analysis) y el pre-filtro, el scoring, los
+# tags y la modalidad leen sus señales del mismo resultado.
+_SCANNER_CATEGORIES = {
+    # Pre-filtro (título)
+    "area_excluded": EXCLUDED_AREA_TERMS_TITLE,
+    "seniority_excluded": EXCLUDED_SENIORITYS,
+    # Scoring
+    "it_signals": REQUIRED_IT_SIGNALS,
+    "weak_it_signals": WEAK_IT_SIGNALS,
+    "strong_tech": STRONG_TECH_SIGNALS,
+    "positive_seniority": POSITIVE_SENIORITY_TERMS,
+    "strong_roles": STRONG_ROLE_SIGNALS,
+    "ambiguous_roles": AMBIGUOUS_ROLES,
+    "it_word": ["it"],
+    # Tags y modalidad
+    **{f"tags:{category}": keywords for category, keywords in TAGS_KEYWORDS.items()},
+    **{f"modality:{kind}": terms for kind, terms in MODALITY_TERMS.items()},
+}
+# En la modalidad cada espacio admite cualquier cantidad de espacios (`\s*`)
+_FLEXIBLE_WHITESPACE_CATEGORIES = {f"modality:{kind}" for kind in MODALITY_TERMS}
 
-_REGEX_AMBIGUOUS_ROLES = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in AMBIGUOUS_ROLES),
-    re.IGNORECASE | re.UNICODE,
+_TEXT_SCANNER = TermScanner(
+    _SCANNER_CATEGORIES, flexible_whitespace=_FLEXIBLE_WHITESPACE_CATEGORIES
 )
 
-_REGEX_IT_SIGNALS = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in REQUIRED_IT_SIGNALS),
-    re.IGNORECASE | re.UNICODE,
-)
 
-_REGEX_WEAK_IT_SIGNALS = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in WEAK_IT_SIGNALS),
-    re.IGNORECASE | re.UNICODE,
-)
+def _senior_patterns_first_chars(patterns):
+    """Clase de caracteres con los que empieza algún patrón (o "" si no se puede deducir)."""
+    first_chars = set()
+    for pattern in patterns:
+        if pattern.startswith(r"(\d+)"):
+            first_chars.add(r"\d")
+        elif pattern[:1].isalpha():
+            first_chars.add(pattern[0])
+        else:
+            return ""
+    return "(?=[" + "".join(sorted(first_chars)) + "])"
 
-_REGEX_STRONG_ROLE_SIGNALS = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in STRONG_ROLE_SIGNALS),
-    re.IGNORECASE | re.UNICODE,
-)
 
-_REGEX_STRONG_TECH_SIGNALS = re.compile(
-    "|".join(r"(?<!\w)" + re.escape(s) + r"(?!\w)" for s in STRONG_TECH_SIGNALS),
+# Todos los patrones de experiencia senior en una sola regex. Cada patrón va en
+# un lookahead opcional con nombre (`pattern_N` / `years_N`) para saber cuáles
+# coinciden en cada posición; los lookaheads iniciales descartan rápido las
+# posiciones en las que no coincide ninguno.
+_REGEX_SENIOR_EXPERIENCE = re.compile(
+    _senior_patterns_first_chars(SENIOR_EXPERIENCE_PATTERNS)
+    + "(?="
+    + "|".join(p.replace(r"(\d+)", r"\d+", 1) for p in SENIOR_EXPERIENCE_PATTERNS)
+    + ")"
+    + "".join(
+        f"(?:(?=(?P<pattern_{i}>"
+        + p.replace(r"(\d+)", f"(?P<years_{i}>\\d+)", 1)
+        + "))|)"
+        for i, p in enumerate(SENIOR_EXPERIENCE_PATTERNS)
+    ),
     re.IGNORECASE | re.UNICODE,
 )
 
-
 print("✅ Regex patterns compiled")
@@ -1,7 +1,39 @@
 import math
+import numbers
+import re
 import zoneinfo
-from datetime import datetime
-import dateparser
+from datetime import date as date_type, datetime
+from functools import lru_cache
+
+import pandas as pd
+
+from config import DATE_PARSE_CACHE_SIZE
+
+_UTC = zoneinfo.ZoneInfo("UTC")
+
+_DATEPARSER_SETTINGS = {
+    "TIMEZONE": "UTC",
+    "RETURN_AS_TIMEZONE_AWARE": True,
+    "DATE_ORDER": "YMD",
+    "PREFER_DAY_OF_MONTH": "first",
+}
+
+# Timestamps representables como datetime (años 1 a 9999)
+_MIN_TIMESTAMP = -62135596800
+_MAX_TIMESTAMP = 253402300800
+
+# ISO 8601 que dateparser también acepta: fecha, hora opcional y offset opcional
+_ISO_REGEX = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+)
+
+# Formatos fijos que se resuelven con strptime antes de recurrir a dateparser
+_STRPTIME_FORMATS = [
+    (re.compile(r"\d{4}/\d{2}/\d{2}"), "%Y/%m/%d"),
+    (re.compile(r"\d{2}-\d{2}-\d{4}"), "%d-%m-%Y"),
+    (re.compile(r"\d{2}/\d{2}/\d{4}"), "%d/%m/%Y"),
+]
 
 
 def safe_parse_date_to_ISO(date):
@@ -11,34 +43,17 @@ def safe_parse_date_to_ISO(date):
     - Siempre devuelve cadena compatible con pd.to_datetime().
     - Quita microsegundos para evitar problemas con pandas.
     """
-    tz = zoneinfo.ZoneInfo("UTC")
-    now = datetime.now(tz)
+    now = datetime.now(_UTC)
 
-    if date is None or (isinstance(date, float) and math.isnan(date)):
+    if date is None or date is pd.NaT or (isinstance(date, float) and math.isnan(date)):
         return now.replace(microsecond=0).isoformat()
 
-    settings = {
-        "TIMEZONE": "UTC",
-        "RETURN_AS_TIMEZONE_AWARE": True,
-        "DATE_ORDER": "YMD",
-        "PREFER_DAY_OF_MONTH": "first",
-    }
-
     try:
-        parsed_date = None
-        if isinstance(date, (int, float)) and not math.isnan(date):
-            parsed_date = datetime.fromtimestamp(date, tz=tz)
-        else:
-            parsed_date = dateparser.parse(
-                str(date), settings=settings, languages=["es", "en"]
-            )
+        parsed_date = _parse_date(date)
 
         if not parsed_date:
             return now.replace(microsecond=0).isoformat()
 
-        if parsed_date.tzinfo is None:
-            parsed_date = parsed_date.replace(tzinfo=tz)
-
         parsed_date = parsed_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
         return parsed_date.isoformat()
@@ -46,3 +61,111 @@ def safe_parse_date_to_ISO(date):
     except Exception:
         fallback = now.replace(hour=0, minute=0, second=0, microsecond=0)
         return fallback.isoformat()
+
+
+def normalize_date_series(series):
+    """
+    Versión vectorizada de safe_parse_date_to_ISO para una columna completa:
+    devuelve datetimes UTC truncados al día (NaT si quedan fuera de rango).
+
+    Timestamps numéricos y strings ISO se convierten de una vez con
+    pd.to_datetime; el resto (y lo que ahí no se pudo convertir) pasa por
+    safe_parse_date_to_ISO.
+    """
+    result = pd.Series(pd.NaT, index=series.index, dtype="datetime64[us, UTC]")
+    if series.empty:
+        return result
+
+    values = series.to_numpy(dtype=object)
+    is_number = pd.Series(
+        [
+            isinstance(value, numbers.Real)
+            and not isinstance(value, bool)
+            and _MIN_TIMESTAMP <= value < _MAX_TIMESTAMP
+            for value in values
+        ],
+        index=series.index,
+    )
+    is_iso = pd.Series(
+        [
+            isinstance(value, str) and _ISO_REGEX.fullmatch(value) is not None
+            for value in values
+        ],
+        index=series.index,
+    )
+
+    if is_number.any():
+        result[is_number] = _floor_to_day(
+            pd.to_datetime(
+                series[is_number].astype("float64"),
+                unit="s",
+                utc=True,
+                errors="coerce",
+            )
+        )
+    if is_iso.any():
+        result[is_iso] = _floor_to_day(
+            pd.to_datetime(series[is_iso], format="ISO8601", utc=True, errors="coerce")
+        )
+
+    pending = result.isna()
+    if pending.any():
+        result[pending] = pd.to_datetime(
+            series[pending].map(safe_parse_date_to_ISO),
+            format="ISO8601",
+            utc=True,
+            errors="coerce",
+        ).astype("datetime64[us, UTC]")
+    return result
+
+
+def _floor_to_day(dates):
+    return dates.dt.floor("D").astype("datetime64[us, UTC]")
+
+
+def _parse_date(date):
+    """datetime con timezone (sin truncar) o None si no se reconoce la fecha."""
+    if isinstance(date, numbers.Real):
+        return datetime.fromtimestamp(date, tz=_UTC)
+    if isinstance(date, datetime):
+        if date.tzinfo is None:
+            return date.replace(tzinfo=_UTC)
+        return date.astimezone(_UTC)
+    if isinstance(date, date_type):
+        return datetime(date.year, date.month, date.day, tzinfo=_UTC)
+    return _parse_date_string(str(date))
+
+
+@lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse_date_string(text):
+    """
+    Parsea un string de fecha: primero ISO y formatos fijos, dateparser como
+    último recurso. Las fechas relativas ("hace 3 días") se calculan la primera
+    vez que aparecen y quedan cacheadas durante la ejecución.
+    """
+    if _ISO_REGEX.fullmatch(text):
+        try:
+            parsed_date = datetime.fromisoformat(text)
+        except ValueError:
+            parsed_date = None
+        if parsed_date:
+            if parsed_date.tzinfo is None:
+                return parsed_date.replace(tzinfo=_UTC)
+            return parsed_date.astimezone(_UTC)
+
+    for regex, date_format in _STRPTIME_FORMATS:
+        if regex.fullmatch(text):
+            try:
+                return datetime.strptime(text, date_format).replace(tzinfo=_UTC)
+            except ValueError:
+                break
+
+    # dateparser tarda ~0.3s en importarse: solo se carga si hace falta
+    import dateparser
+
+    parsed_date = dateparser.parse(
+        text, settings=_DATEPARSER_SETTINGS, languages=["es", "en"]
+    )
+    if parsed_date and parsed_date.tzinfo is None:
+        parsed_date = parsed_date.replace(tzinfo=_UTC)
+    return parsed_date
@@ -1,26 +1,47 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
 from datetime import datetime, timedelta
 import zoneinfo
-from google.cloud.firestore_v1.field_path import FieldPath
-from google.cloud.firestore_v1.base_query import FieldFilter
 import pandas as pd
 import asyncio
-from collections import Counter
-
-from utils.revalidation_utils import revalidate_path
-
-# Inicialización de Firebase Admin
-if not firebase_admin._apps:
-    try:
-        cred = credentials.ApplicationDefault()
-        firebase_admin.initialize_app(cred)
-        print("✅ Firebase Admin SDK inicializado.")
-    except Exception as e:
-        print(f"❌ Error al inicializar Firebase Admin SDK: {e}")
-
-
-db = firestore.client()
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config import (
+    FIRESTORE_MAX_CONCURRENCY,
+    FIRESTORE_MAX_RETRIES,
+    FIRESTORE_MAX_BATCH_WRITES,
+    FIRESTORE_MAX_BATCH_BYTES,
+)
+
+from utils.revalidation_utils import get_revalidator
+from utils.seen_ids_utils import get_seen_store
+
+# El SDK de Firebase se importa e inicializa recién en el primer uso, así los
+# imports (y las ejecuciones sin Firestore) no necesitan credenciales
+_db = None
+_db_lock = threading.Lock()
+
+
+def get_db():
+    """Cliente de Firestore; inicializa Firebase Admin la primera vez."""
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                import firebase_admin
+                from firebase_admin import credentials, firestore
+
+                if not firebase_admin._apps:
+                    try:
+                        cred = credentials.ApplicationDefault()
+                        firebase_admin.initialize_app(cred)
+                        print("✅ Firebase Admin SDK inicializado.")
+                    except Exception as e:
+                        print(f"❌ Error al inicializar Firebase Admin SDK: {e}")
+
+                _db = firestore.client()
+    return _db
 
 
 def get_new_jobs(jobs_list):
@@ -36,23 +57,27 @@ def get_new_jobs(jobs_list):
     if not job_ids_to_check:
         return jobs_list
 
-    existing_ids = set()
-    job_ids_list = list(job_ids_to_check)
-
-    try:
-        # Verificar en lotes de 30
-        for i in range(0, len(job_ids_list), 30):
-            chunk = job_ids_list[i : i + 30]
-
-            docs = db.get_all(
-                [db.collection("jobs").document(doc_id) for doc_id in chunk]
-            )
-
-            existing_ids.update(doc.id for doc in docs if doc.exists)
+    # Los IDs del índice local ya están en Firestore: no hace falta consultarlos
+    seen_store = get_seen_store()
+    existing_ids = seen_store.known(job_ids_to_check) if seen_store else set()
+    job_ids_list = list(job_ids_to_check - existing_ids)
+    if existing_ids:
+        print(f"⚡ {len(existing_ids)} IDs ya conocidos por el índice local.")
+
+    # Consultas en paralelo; si un lote falla del todo, sus IDs se tratan como nuevos
+    remote_existing, failed_ids = check_existing_job_ids(job_ids_list)
+    existing_ids.update(remote_existing)
+    if failed_ids:
+        print(
+            f"⚠️ No se pudieron verificar {len(failed_ids)} IDs en Firestore; "
+            "se tratan como nuevos."
+        )
 
-    except Exception as e:
-        print(f"❌ Error al verificar trabajos en Firestore: {e}")
-        return jobs_list
+    if seen_store:
+        seen_store.add(
+            (doc_id, data.get("status"), data.get("date_scraped"))
+            for doc_id, data in remote_existing.items()
+        )
 
     new_job_ids = job_ids_to_check - existing_ids
     new_jobs = [job for job in jobs_list if str(job.get("id")) in new_job_ids]
@@ -61,18 +86,72 @@ def get_new_jobs(jobs_list):
     return new_jobs
 
 
+def check_existing_job_ids(job_ids, chunk_size=30):
+    """
+    Verifica en paralelo qué IDs existen en la colección 'jobs'.
+    Cada lote de `chunk_size` IDs se consulta en un thread (hasta
+    FIRESTORE_MAX_CONCURRENCY a la vez) y se reintenta por separado si falla.
+
+    Returns:
+        (existentes, fallidos): dict {id: datos del documento} con los que existen
+        y set con los IDs de los lotes que fallaron después de los reintentos.
+    """
+    job_ids = list(job_ids)
+    chunks = [job_ids[i : i + chunk_size] for i in range(0, len(job_ids), chunk_size)]
+    if not chunks:
+        return {}, set()
+
+    existing = {}
+    failed_ids = set()
+    max_workers = max(1, min(FIRESTORE_MAX_CONCURRENCY, len(chunks)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_with_retries, _get_existing_docs, chunk): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                existing.update(future.result())
+            except Exception as e:
+                print(f"❌ Error al verificar un lote de trabajos en Firestore: {e}")
+                failed_ids.update(futures[future])
+
+    return existing, failed_ids
+
+
+def _get_existing_docs(chunk, collection_name="jobs"):
+    """Un round trip a Firestore: devuelve {id: datos} de los documentos que existen."""
+    db = get_db()
+    collection = db.collection(collection_name)
+    docs = db.get_all([collection.document(doc_id) for doc_id in chunk])
+    return {doc.id: doc.to_dict() or {} for doc in docs if doc.exists}
+
+
+def _with_retries(func, *args):
+    """Ejecuta func con hasta FIRESTORE_MAX_RETRIES reintentos y backoff exponencial."""
+    for attempt in range(FIRESTORE_MAX_RETRIES + 1):
+        try:
+            return func(*args)
+        except Exception:
+            if attempt == FIRESTORE_MAX_RETRIES:
+                raise
+            time.sleep(0.5 * 2**attempt)
+
+
 async def save_jobs_to_firestore(jobs_list):
+    """
+    Guarda los jobs en la colección 'jobs'. Devuelve True si se escribieron
+    todos (los lotes que fallan se informan y se descartan).
+    """
     if not jobs_list:
-        return
+        return True
 
     print(f"💾 Guardando {len(jobs_list)} jobs en Firestore...")
 
-    jobs_batch = db.batch()
-    jobs_collection = db.collection("jobs")
     today_date = datetime.now(zoneinfo.ZoneInfo("UTC")).date()
-
-    today_jobs_count = 0
-    previous_jobs_count = 0
+    documents = []
+    published_dates = {}
 
     for job in jobs_list:
         job_id = job.get("id")
@@ -86,85 +165,347 @@ async def save_jobs_to_firestore(jobs_list):
             published_date = today_date
 
         job["published_date"] = published_date.isoformat()
-
-        doc_ref_jobs = jobs_collection.document(str(job_id))
-        jobs_batch.set(doc_ref_jobs, job)
-
-        if published_date == today_date:
-            today_jobs_count += 1
-        else:
-            previous_jobs_count += 1
+        documents.append((str(job_id), job))
+        published_dates[str(job_id)] = published_date
 
     try:
-        jobs_batch.commit()
+        # Las escrituras son bloqueantes: se hacen fuera del event loop
+        written_ids = await asyncio.to_thread(write_documents, "jobs", documents)
+
+        seen_store = get_seen_store()
+        if seen_store:
+            seen_store.add(
+                (doc_id, job.get("status"), job.get("date_scraped"))
+                for doc_id, job in documents
+                if doc_id in written_ids
+            )
+
+        today_jobs_count = sum(
+            1 for doc_id in written_ids if published_dates[doc_id] == today_date
+        )
+        previous_jobs_count = len(written_ids) - today_jobs_count
 
-        revalidation_tasks = []
+        # Las rutas se revalidan una vez, después de que terminan las
+        # escrituras seguidas (ver RevalidationDispatcher)
+        revalidator = get_revalidator()
 
         if today_jobs_count > 0:
             print(f"✅ {today_jobs_count} jobs de hoy guardados.")
-            revalidation_tasks.append(revalidate_path("/"))
+            revalidator.request("/")
 
         if previous_jobs_count > 0:
             print(f"✅ {previous_jobs_count} jobs anteriores guardados.")
-            revalidation_tasks.append(revalidate_path("/archive"))
+            revalidator.request("/archive")
 
-        if revalidation_tasks:
-            await asyncio.gather(*revalidation_tasks)
+        failed_ids = {doc_id for doc_id, _ in documents} - written_ids
+        if failed_ids:
+            print(f"❌ {len(failed_ids)} jobs no se pudieron guardar en Firestore.")
+        return not failed_ids
 
     except Exception as e:
         print(f"❌ Error al guardar jobs en Firestore: {e}")
+        return False
 
 
-def save_monthly_trend_data(trend_data, month_key):
+def write_documents(collection_name, documents):
     """
-    Guarda o actualiza las tendencias de un mes.
-    Si el documento del mes ya existe, actualiza los contadores.
-    Si no existe, lo crea.
+    Escribe documentos [(id, datos)] en una colección, en lotes que respetan
+    los límites de Firestore (cantidad de escrituras y bytes por request).
+    Los lotes se escriben en paralelo y un lote que falla no afecta a los demás.
+    Usa el BulkWriter del SDK si está disponible; si no, `db.batch()` con reintentos.
+
+    Returns:
+        set con los IDs escritos correctamente.
+    """
+    chunks = split_in_batches(documents)
+    if not chunks:
+        return set()
+
+    write_chunk = (
+        _bulk_write_chunk if hasattr(get_db(), "bulk_writer") else _commit_chunk
+    )
+    written_ids = set()
+    max_workers = max(1, min(FIRESTORE_MAX_CONCURRENCY, len(chunks)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_timed, write_chunk, collection_name, chunk): index
+            for index, chunk in enumerate(chunks, start=1)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            chunk = chunks[index - 1]
+            try:
+                chunk_written, elapsed = future.result()
+            except Exception as e:
+                print(
+                    f"❌ Lote {index}/{len(chunks)} ({len(chunk)} docs) "
+                    f"no se pudo escribir en '{collection_name}': {e}"
+                )
+                continue
+
+            written_ids.update(chunk_written)
+            failed = len(chunk) - len(chunk_written)
+            status = "✅" if not failed else "⚠️"
+            print(
+                f"  {status} Lote {index}/{len(chunks)}: {len(chunk_written)}/{len(chunk)} "
+                f"docs escritos en {elapsed:.2f}s"
+            )
+
+    return written_ids
+
+
+def split_in_batches(
+    documents,
+    max_writes=FIRESTORE_MAX_BATCH_WRITES,
+    max_bytes=FIRESTORE_MAX_BATCH_BYTES,
+):
+    """Divide [(id, datos)] en lotes por cantidad de escrituras y bytes estimados."""
+    chunks = []
+    current, current_bytes = [], 0
+
+    for doc_id, data in documents:
+        size = _estimate_document_size(doc_id, data)
+        if current and (len(current) >= max_writes or current_bytes + size > max_bytes):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append((doc_id, data))
+        current_bytes += size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _estimate_document_size(doc_id, data):
+    """Tamaño aproximado de la escritura (JSON del documento + ruta y overhead)."""
+    payload = json.dumps(data, default=str, ensure_ascii=False)
+    return len(payload.encode("utf-8")) + len(doc_id) + 256
+
+
+def _timed(func, *args):
+    """Ejecuta func y devuelve (resultado, segundos)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _commit_chunk(collection_name, chunk):
+    """Escribe un lote con `db.batch()` (todo o nada) reintentando con backoff."""
+
+    db = get_db()
+
+    def commit():
+        batch = db.batch()
+        collection = db.collection(collection_name)
+        for doc_id, data in chunk:
+            batch.set(collection.document(doc_id), data)
+        batch.commit()
+
+    _with_retries(commit)
+    return {doc_id for doc_id, _ in chunk}
+
+
+def _bulk_write_chunk(collection_name, chunk):
+    """
+    Escribe un lote con el BulkWriter del SDK: cada documento se escribe y
+    reintenta (con backoff) por separado, así un documento inválido solo
+    pierde su propia escritura.
+    """
+    written_ids = set()
+    failures = []
+
+    def on_write_result(reference, result, bulk_writer):
+        written_ids.add(reference.id)
+
+    def on_write_error(failure, bulk_writer):
+        if failure.attempts < FIRESTORE_MAX_RETRIES:
+            return True
+        failures.append(f"{failure.operation.reference.id}: {failure.message}")
+        return False
+
+    from google.cloud.firestore_v1.bulk_writer import BulkRetry, BulkWriterOptions
+
+    db = get_db()
+    bulk_writer = db.bulk_writer(BulkWriterOptions(retry=BulkRetry.exponential))
+    bulk_writer.on_write_result(on_write_result)
+    bulk_writer.on_write_error(on_write_error)
+
+    collection = db.collection(collection_name)
+    for doc_id, data in chunk:
+        bulk_writer.set(collection.document(doc_id), data)
+    bulk_writer.close()
+
+    for failure in failures:
+        print(f"❌ Error al escribir el documento {failure}")
+    return written_ids
+
+
+def save_monthly_trend_data(trend_data, month_key, day_key=None):
+    """
+    Suma las tendencias de la ejecución al documento del mes con incrementos
+    atómicos (sin leer el documento antes), así ejecuciones solapadas no se pisan.
+    Si se pasa `day_key`, en la misma escritura se suma también al documento
+    del día en la colección 'trends_daily'.
     """
     if not trend_data:
         return
 
-    trends_collection = db.collection("trends")
-    doc_ref = trends_collection.document(month_key)
+    from google.cloud.firestore_v1.transforms import Increment
+
+    db = get_db()
+    date_saved = datetime.now(zoneinfo.ZoneInfo("UTC")).isoformat()
+    increments = {
+        "total_jobs": Increment(trend_data.get("total_jobs", 0)),
+        "date_saved": date_saved,
+    }
+    tags = trend_data.get("tags") or {}
+    # Un mapa "tags" vacío con merge=True reemplaza los contadores del mes por {}:
+    # solo se escribe si hay tags que sumar
+    if tags:
+        increments["tags"] = {tag: Increment(count) for tag, count in tags.items()}
 
     try:
-        doc = doc_ref.get()
-        if doc.exists:
-            # El documento existe, actualizar
-            current_data = doc.to_dict()
-            current_total = current_data.get("total_jobs", 0)
-            new_total = trend_data.get("total_jobs", 0)
-
-            current_tags = Counter(current_data.get("tags", {}))
-            new_tags = Counter(trend_data.get("tags", {}))
-            current_tags.update(new_tags)
-
-            updated_data = {
-                "total_jobs": current_total + new_total,
-                "tags": dict(current_tags),
-                "date_saved": datetime.now(zoneinfo.ZoneInfo("UTC")).isoformat(),
-            }
-            doc_ref.set(updated_data)
-            print(f"📈 Tendencias para {month_key} actualizadas en Firestore.")
-        else:
-            # El documento no existe, crearlo
-            trend_data["date_saved"] = datetime.now(
-                zoneinfo.ZoneInfo("UTC")
-            ).isoformat()
-            doc_ref.set(trend_data)
-            print(f"📈 Tendencias para {month_key} creadas en Firestore.")
+        batch = db.batch()
+        # Con merge=True las claves de "tags" se tratan como claves del mapa
+        # (no como rutas), así que tags con puntos no necesitan escaparse
+        batch.set(db.collection("trends").document(month_key), increments, merge=True)
+        if day_key:
+            batch.set(
+                db.collection("trends_daily").document(day_key),
+                increments,
+                merge=True,
+            )
+        batch.commit()
+        print(f"📈 Tendencias para {month_key} actualizadas en Firestore.")
 
     except Exception as e:
         print(f"❌ Error al guardar tendencias en Firestore: {e}")
 
 
-def delete_old_documents(collection_name, days_to_keep, status=None):
+def enqueue_outbox(jobs):
+    """
+    Guarda los jobs a notificar en la colección 'outbox'. El ID del documento
+    es el ID del job, así encolar dos veces el mismo job no lo duplica.
+    Devuelve el set de IDs encolados.
+    """
+    date_scraped = datetime.now(zoneinfo.ZoneInfo("UTC")).isoformat()
+    documents = [
+        (str(job["id"]), {"job": job, "attempts": 0, "date_scraped": date_scraped})
+        for job in jobs
+        if job.get("id")
+    ]
+    written_ids = write_documents("outbox", documents)
+
+    failed_ids = {doc_id for doc_id, _ in documents} - written_ids
+    if failed_ids:
+        print(
+            f"⚠️ {len(failed_ids)} jobs no se pudieron guardar en el outbox; "
+            f"su envío no es durable: {', '.join(sorted(failed_ids))}"
+        )
+    return written_ids
+
+
+def get_pending_outbox(max_attempts):
+    """Jobs del outbox que quedaron sin enviar y todavía tienen intentos disponibles."""
+    pending = []
+    try:
+        for doc in get_db().collection("outbox").stream():
+            data = doc.to_dict() or {}
+            if data.get("sent_at"):
+                continue
+            if data.get("job") and data.get("attempts", 0) < max_attempts:
+                pending.append(data["job"])
+    except Exception as e:
+        print(f"❌ Error al leer el outbox de Firestore: {e}")
+    return pending
+
+
+def get_sent_outbox_ids(job_ids, chunk_size=100):
+    """
+    IDs del outbox que ya se enviaron (tienen `sent_at`). Si la consulta falla
+    devuelve los encontrados hasta ese momento.
+    """
+    job_ids = [str(job_id) for job_id in job_ids]
+    sent_ids = set()
+    try:
+        for i in range(0, len(job_ids), chunk_size):
+            docs = _with_retries(
+                _get_existing_docs, job_ids[i : i + chunk_size], "outbox"
+            )
+            sent_ids.update(
+                doc_id for doc_id, data in docs.items() if data.get("sent_at")
+            )
+    except Exception as e:
+        print(f"❌ Error al leer el outbox de Firestore: {e}")
+    return sent_ids
+
+
+def mark_outbox_sent(job_ids):
+    """
+    Marca con `sent_at` los jobs del outbox ya enviados. No se borran: el ID
+    marcado evita que otra ejecución vuelva a notificar el mismo job (ej: si
+    falló su guardado en 'jobs'). La limpieza los borra con la retención.
+    """
+    sent_at = datetime.now(zoneinfo.ZoneInfo("UTC")).isoformat()
+    _update_outbox(
+        job_ids, lambda batch, ref: batch.set(ref, {"sent_at": sent_at}, merge=True)
+    )
+
+
+def record_outbox_failures(job_ids):
+    """Suma un intento fallido a los jobs del outbox que no se pudieron enviar."""
+    from google.cloud.firestore_v1.transforms import Increment
+
+    # set con merge en lugar de update: update falla con NotFound si el documento
+    # no existe (ej: el enqueue falló) y tira abajo todo el lote
+    _update_outbox(
+        job_ids,
+        lambda batch, ref: batch.set(ref, {"attempts": Increment(1)}, merge=True),
+    )
+
+
+def _update_outbox(job_ids, operation):
+    job_ids = list(job_ids)
+    db = get_db()
+    outbox = db.collection("outbox")
+    try:
+        for i in range(0, len(job_ids), FIRESTORE_MAX_BATCH_WRITES):
+            batch = db.batch()
+            for job_id in job_ids[i : i + FIRESTORE_MAX_BATCH_WRITES]:
+                operation(batch, outbox.document(str(job_id)))
+            _with_retries(batch.commit)
+    except Exception as e:
+        print(f"❌ Error al actualizar el outbox en Firestore: {e}")
+
+
+def get_state_document(doc_id):
+    """Lee un documento de estado del bot (colección 'state'). Devuelve None si no existe."""
+    try:
+        doc = get_db().collection("state").document(doc_id).get()
+        return doc.to_dict() if doc.exists else None
+    except Exception as e:
+        print(f"❌ Error al leer el estado '{doc_id}' de Firestore: {e}")
+        return None
+
+
+def save_state_document(doc_id, data):
+    """Guarda (reemplaza) un documento de estado del bot en la colección 'state'."""
+    try:
+        get_db().collection("state").document(doc_id).set(data)
+    except Exception as e:
+        print(f"❌ Error al guardar el estado '{doc_id}' en Firestore: {e}")
+
+
+def delete_old_documents(collection_name, days_to_keep, status=None, deadline=None):
     """
     Elimina documentos de una colección que son más antiguos que un número de días.
+    Si se pasa `deadline` (time.monotonic()), se detiene al alcanzarlo.
+    Devuelve la cantidad de documentos eliminados.
     """
     if not days_to_keep or days_to_keep <= 0:
         print(f"⚠️ La retención de '{collection_name}' está desactivada (días <= 0).")
-        return
+        return 0
 
     status_log = f" con estado '{status}'" if status else ""
     print(
@@ -175,53 +516,48 @@ def delete_old_documents(collection_name, days_to_keep, status=None):
         cutoff_date = datetime.now(zoneinfo.ZoneInfo("UTC")) - timedelta(
             days=days_to_keep
         )
-        cutoff_iso = cutoff_date.isoformat()
+        from google.cloud.firestore_v1.base_query import FieldFilter
 
-        deleted_total = 0
-
-        # Loop hasta que no haya más documentos que borrar
-        while True:
-            query = db.collection(collection_name).where(
-                filter=FieldFilter("date_scraped", "<", cutoff_iso)
-            )
-            if status:
-                query = query.where(filter=FieldFilter("status", "==", status))
-
-            docs_to_delete = list(query.limit(500).stream())
-
-            if not docs_to_delete:
-                break
-
-            batch = db.batch()
-            for doc in docs_to_delete:
-                batch.delete(doc.reference)
-
-            batch.commit()
-            deleted_total += len(docs_to_delete)
+        query = (
+            get_db()
+            .collection(collection_name)
+            .where(filter=FieldFilter("date_scraped", "<", cutoff_date.isoformat()))
+        )
+        if status:
+            query = query.where(filter=FieldFilter("status", "==", status))
 
-            print(f"  Eliminados {len(docs_to_delete)} documentos...")
+        deleted_total, completed = _delete_query_results(
+            query.order_by("date_scraped"), deadline
+        )
 
-        if deleted_total > 0:
+        if not completed:
             print(
-                f"✅ Se eliminaron {deleted_total} documentos antiguos de '{collection_name}'."
+                f"⏱️ Limpieza de '{collection_name}'{status_log} interrumpida por tiempo "
+                f"({deleted_total} documentos eliminados); se retoma en la próxima ejecución."
+            )
+        elif deleted_total > 0:
+            print(
+                f"✅ Se eliminaron {deleted_total} documentos antiguos de '{collection_name}'{status_log}."
             )
         else:
             print(
-                f"✅ No se encontraron documentos antiguos para eliminar en '{collection_name}'."
+                f"✅ No se encontraron documentos antiguos para eliminar en '{collection_name}'{status_log}."
             )
+        return deleted_total
 
     except Exception as e:
         print(f"❌ Error al limpiar documentos antiguos de '{collection_name}': {e}")
+        return 0
 
 
-def delete_old_trends(days_to_keep):
+def delete_old_trends(days_to_keep, collection_name="trends", deadline=None):
     """
-    Elimina documentos de la colección 'trends' que son más antiguos que un número de días.
+    Elimina documentos de una colección de tendencias ('trends' o 'trends_daily')
+    que son más antiguos que un número de días. Devuelve la cantidad eliminada.
     """
-    collection_name = "trends"
     if not days_to_keep or days_to_keep <= 0:
         print(f"⚠️ La retención de '{collection_name}' está desactivada (días <= 0).")
-        return
+        return 0
 
     print(
         f"🧹 Limpiando tendencias antiguas de '{collection_name}' (retención: {days_to_keep} días)..."
@@ -231,36 +567,65 @@ def delete_old_trends(days_to_keep):
         cutoff_date = datetime.now(zoneinfo.ZoneInfo("UTC")) - timedelta(
             days=days_to_keep
         )
-        cutoff_iso = cutoff_date.isoformat()
-
-        deleted_total = 0
-
-        while True:
-            docs_to_delete = list(
-                db.collection(collection_name)
-                .where(filter=FieldFilter("date_saved", "<", cutoff_iso))
-                .limit(500)
-                .stream()
-            )
-
-            if not docs_to_delete:
-                break
-
-            batch = db.batch()
-            for doc in docs_to_delete:
-                batch.delete(doc.reference)
+        from google.cloud.firestore_v1.base_query import FieldFilter
 
-            batch.commit()
-            deleted_total += len(docs_to_delete)
+        query = (
+            get_db()
+            .collection(collection_name)
+            .where(filter=FieldFilter("date_saved", "<", cutoff_date.isoformat()))
+            .order_by("date_saved")
+        )
 
-            print(f"  Eliminadas {len(docs_to_delete)} tendencias...")
+        deleted_total, completed = _delete_query_results(query, deadline)
 
-        if deleted_total > 0:
+        if not completed:
+            print(
+                f"⏱️ Limpieza de '{collection_name}' interrumpida por tiempo "
+                f"({deleted_total} tendencias eliminadas)."
+            )
+        elif deleted_total > 0:
             print(
                 f"✅ Se eliminaron {deleted_total} tendencias antiguas de '{collection_name}'."
             )
         else:
-            print(f"✅ No se encontraron tendencias antiguas para eliminar.")
+            print(f"✅ No se encontraron tendencias antiguas en '{collection_name}'.")
+        return deleted_total
 
     except Exception as e:
         print(f"❌ Error al limpiar tendencias antiguas de '{collection_name}': {e}")
+        return 0
+
+
+def _delete_query_results(query, deadline=None, page_size=500):
+    """
+    Borra los documentos que devuelve `query` (ordenada) en páginas de
+    `page_size`, avanzando con un cursor en lugar de volver a ejecutar la
+    consulta desde el principio.
+
+    Returns:
+        (eliminados, completo): completo es False si se alcanzó el deadline.
+    """
+    deleted_total = 0
+    last_doc = None
+
+    while True:
+        if deadline is not None and time.monotonic() >= deadline:
+            return deleted_total, False
+
+        page = query.limit(page_size)
+        if last_doc is not None:
+            page = page.start_after(last_doc)
+        docs = list(page.stream())
+        if not docs:
+            return deleted_total, True
+
+        batch = get_db().batch()
+        for doc in docs:
+            batch.delete(doc.reference)
+        # Borrar es idempotente: el lote se puede reintentar sin riesgo
+        _with_retries(batch.commit)
+        deleted_total += len(docs)
+
+        if len(docs) < page_size:
+            return deleted_total, True
+        last_doc = docs[-1]
@@ -0,0 +1,111 @@
+import json
+import os
+import sys
+import time
+import zoneinfo
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Pico de memoria residente del proceso hasta ahora, en MB (None si no se puede medir)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo informa en KB, macOS en bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class RunReport:
+    """
+    Registro liviano de una ejecución: tiempo real, CPU, pico de memoria y
+    filas de cada etapa (por fuente cuando corresponde).
+
+    El CPU es el del proceso completo durante la etapa, así que incluye lo que
+    corre en paralelo (otras fuentes, limpieza, envíos).
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now(zoneinfo.ZoneInfo("UTC"))
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name, source=None, rows_in=None):
+        """
+        Mide el bloque como una etapa. El registro que se entrega permite
+        completar las filas de salida: `stage["rows_out"] = len(df)` (por
+        defecto, las mismas que entraron).
+        """
+        record = {"stage": name, "source": source, "rows_in": rows_in}
+        record["rows_out"] = rows_in
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            self.add(
+                name,
+                time.perf_counter() - start,
+                time.process_time() - cpu_start,
+                source=source,
+                rows_in=record["rows_in"],
+                rows_out=record["rows_out"],
+            )
+
+    def add(self, name, wall_seconds, cpu_seconds, source=None, **rows):
+        """Agrega una etapa medida por fuera (ej: dentro de un thread)."""
+        self.stages.append(
+            {
+                "stage": name,
+                "source": source,
+                "wall_seconds": round(wall_seconds, 4),
+                "cpu_seconds": round(cpu_seconds, 4),
+                "peak_rss_mb": peak_rss_mb(),
+                "rows_in": rows.get("rows_in"),
+                "rows_out": rows.get("rows_out"),
+            }
+        )
+
+    def to_dict(self):
+        return {
+            "started_at": self.started_at.isoformat(),
+            "wall_seconds": round(time.perf_counter() - self._start, 4),
+            "cpu_seconds": round(time.process_time() - self._cpu_start, 4),
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": self.stages,
+        }
+
+    def write(self, path):
+        """Guarda el reporte como JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def summary(self):
+        """Una línea con el total y el tiempo real de cada etapa (sumado entre lotes)."""
+        report = self.to_dict()
+        totals = {}
+        for stage in self.stages:
+            name = stage["stage"]
+            if name == "fetch" and stage["source"]:
+                name = f"fetch:{stage['source']}"
+            totals[name] = totals.get(name, 0) + stage["wall_seconds"]
+
+        stages = " · ".join(
+            f"{name} {seconds:.1f}s" for name, seconds in totals.items()
+        )
+        rss = report["peak_rss_mb"]
+        rss = f", RSS pico {rss:.0f} MB" if rss is not None else ""
+        return (
+            f"📊 Ejecución: {report['wall_seconds']:.1f}s, "
+            f"CPU {report['cpu_seconds']:.1f}s{rss} | {stages}"
+        )
@@ -1,22 +1,129 @@
 import asyncio
 import os
-import httpx
+
+from config import (
+    REVALIDATION_DEBOUNCE_SECONDS,
+    REVALIDATION_MAX_RETRIES,
+    REVALIDATION_BATCH_PATHS,
+)
 
 REVALIDATION_SECRET = os.getenv("REVALIDATION_SECRET")
 BASE_URL = os.getenv("BASE_URL")
 
 
-async def revalidate_path(path: str):
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            params = {"secret": REVALIDATION_SECRET, "path": path}
-            r = await client.get(BASE_URL, params=params)
-            if r.status_code != 200:
-                print(f"⚠️ Error revalidando {path}: {r.status_code} - {r.text}")
+class RevalidationDispatcher:
+    """
+    Revalida rutas del sitio una sola vez por cambio.
+
+    `request` junta las rutas pedidas (sin repetir) y las envía recién cuando
+    pasan REVALIDATION_DEBOUNCE_SECONDS sin pedidos nuevos, así las escrituras
+    seguidas de varios lotes generan una sola revalidación por ruta. Todos los
+    envíos comparten un cliente HTTP y se reintentan con backoff exponencial.
+    """
+
+    def __init__(self, base_url=BASE_URL, secret=REVALIDATION_SECRET):
+        self.base_url = base_url
+        self.secret = secret
+        self._pending = set()
+        self._timer = None
+        self._tasks = set()
+        self._client = None
+        self._warned = False
+
+    def request(self, *paths):
+        """Agenda la revalidación de las rutas (no bloquea)."""
+        if not self.base_url:
+            if not self._warned:
+                print("⚠️ BASE_URL no configurada: no se revalida el sitio.")
+                self._warned = True
+            return
+        self._pending.update(paths)
+        if self._timer:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(
+            REVALIDATION_DEBOUNCE_SECONDS, self._flush_in_background
+        )
+
+    async def flush(self):
+        """Revalida ya las rutas pendientes."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        paths = sorted(self._pending)
+        self._pending.clear()
+        if not paths:
+            return
+
+        if REVALIDATION_BATCH_PATHS:
+            await self._send(paths)
+        else:
+            await asyncio.gather(*(self._send([path]) for path in paths))
+
+    async def close(self):
+        """Envía lo pendiente, espera los envíos en curso y cierra el cliente."""
+        await self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    def _flush_in_background(self):
+        self._timer = None
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def _send(self, paths):
+        import httpx
+
+        label = ", ".join(paths)
+        params = [("secret", self.secret)] + [("path", path) for path in paths]
+
+        for attempt in range(REVALIDATION_MAX_RETRIES + 1):
+            try:
+                r = await self._get_client().get(self.base_url, params=params)
+            except asyncio.CancelledError:
+                print(f"⚠️ Revalidación de {label} cancelada")
+                raise
+            except httpx.HTTPError as e:
+                error = f"❌ Error en revalidación de {label}: {e}"
             else:
-                print(f"✅ Revalidado {path} correctamente")
-    except asyncio.CancelledError:
-        print(f"⚠️ Revalidación de {path} cancelada")
-        raise
-    except Exception as e:
-        print(f"❌ Error en revalidación de {path}: {e}")
+                if r.status_code == 200:
+                    print(f"✅ Revalidado {label} correctamente")
+                    return
+                error = f"⚠️ Error revalidando {label}: {r.status_code} - {r.text}"
+                # Los 4xx (secret o ruta inválidos) no se arreglan reintentando
+                if r.status_code < 500 and r.status_code != 429:
+                    break
+
+            if attempt < REVALIDATION_MAX_RETRIES:
+                await asyncio.sleep(0.5 * 2**attempt)
+
+        print(error)
+
+
+_revalidator = None
+
+
+def get_revalidator():
+    """Dispatcher de revalidación compartido por toda la ejecución."""
+    global _revalidator
+    if _revalidator is None:
+        _revalidator = RevalidationDispatcher()
+    return _revalidator
+
+
+async def close_revalidator():
+    """Revalida lo pendiente al terminar la ejecución."""
+    global _revalidator
+    if _revalidator is not None:
+        await _revalidator.close()
+        _revalidator = None
@@ -1,15 +1,17 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
-import re
-from filters_scoring_config import MIN_YEARS_SENIORITY, SENIOR_EXPERIENCE_PATTERNS
-from utils.constants import (
-    _REGEX_AMBIGUOUS_ROLES,
-    _REGEX_AREA_PREFILTER,
-    _REGEX_IT_SIGNALS,
-    _REGEX_POSITIVE_SENIORITY,
-    _REGEX_SENIORITY_EXCLUDED,
-    _REGEX_STRONG_ROLE_SIGNALS,
-    _REGEX_STRONG_TECH_SIGNALS,
-    _REGEX_WEAK_IT_SIGNALS,
+from config import SCORING_PARALLEL_MIN_ROWS, SCORING_PROCESSES
+from utils.text_analysis import (
+    TEXT_ANALYSIS_COLUMN,
+    analyze_text,
+    find_senior_experience_requirement,
+    get_row_text_analysis,
+    get_text_analyses,
+    get_text_column,
 )
 
 
@@ -23,39 +25,52 @@ def pre_filter_jobs(df, verbose=True):
     if df.empty:
         return df, pd.DataFrame()
 
-    initial_count = len(df)
-    if verbose:
-        print(f"\n🔍 Starting pre-filtering for {initial_count} jobs...")
+    # Señales del título leídas del análisis de texto (un solo escaneo por job)
+    rejection_reasons = [
+        _pre_filter_reason(analysis.title) for analysis in get_text_analyses(df)
+    ]
+    return _split_pre_filtered(df, rejection_reasons, verbose)
+
 
-    rejected_indices = []
-    rejection_reasons = {}
+def _pre_filter_reason(title_matches):
+    """Motivo de rechazo del pre-filtro para los TermMatches de un título, o None."""
+    has_area_term = title_matches.search("area_excluded")
 
-    for idx, row in df.iterrows():
-        title = row.get("title_normalized", "")
-        rejection_reason = None
+    # FILTRO 1: Área no-IT
+    # Excepción: no rechazar si contiene un rol IT fuerte
+    if has_area_term and not title_matches.search("strong_roles"):
+        return _format_rejection_reason(title_matches, "area_excluded", "area")
 
-        # FILTRO 1: Área no-IT
-        if _REGEX_AREA_PREFILTER.search(title):
-            # Excepción: no rechazar si contiene un rol IT fuerte
-            if not _REGEX_STRONG_ROLE_SIGNALS.search(title):
-                matches = _REGEX_AREA_PREFILTER.findall(title)
-                rejection_reason = f"area: {', '.join(sorted(set(matches)))}"
+    # FILTRO 2: Seniority (solo si pasó filtro de área)
+    if (
+        not has_area_term
+        and title_matches.search("seniority_excluded")
+        and not title_matches.search("positive_seniority")
+    ):
+        return _format_rejection_reason(
+            title_matches, "seniority_excluded", "seniority"
+        )
 
-        # FILTRO 2: Seniority (solo si pasó filtro de área)
-        elif _REGEX_SENIORITY_EXCLUDED.search(title):
-            if not _REGEX_POSITIVE_SENIORITY.search(title):
-                matches = _REGEX_SENIORITY_EXCLUDED.findall(title)
-                rejection_reason = f"seniority: {', '.join(sorted(set(matches)))}"
+    return None
 
-        if rejection_reason:
-            rejected_indices.append(idx)
-            rejection_reasons[idx] = rejection_reason
+
+def _split_pre_filtered(df, rejection_reasons, verbose):
+    """
+    Separa `df` en (filtrados, rechazados) según el motivo de rechazo de cada
+    fila (por posición, así no depende de que el índice sea único).
+    """
+    initial_count = len(df)
+    if verbose:
+        print(f"\n🔍 Starting pre-filtering for {initial_count} jobs...")
 
     # Crear DataFrames
-    if rejected_indices:
-        df_rejected = df.loc[rejected_indices].copy()
-        df_rejected["rejection_reason"] = df_rejected.index.map(rejection_reasons)
-        df_filtered = df.drop(index=rejected_indices).copy()
+    rejected_mask = pd.Series(rejection_reasons, dtype=object).notna().to_numpy()
+    if rejected_mask.any():
+        df_rejected = df[rejected_mask].copy()
+        df_rejected["rejection_reason"] = [
+            reason for reason in rejection_reasons if reason is not None
+        ]
+        df_filtered = df[~rejected_mask].copy()
     else:
         df_rejected = pd.DataFrame()
         df_filtered = df.copy()
@@ -83,6 +98,11 @@ def pre_filter_jobs(df, verbose=True):
     return df_filtered, df_rejected
 
 
+def _format_rejection_reason(matches, category, label):
+    """Arma el motivo de rechazo ('label: a, b') con los términos encontrados."""
+    return f"{label}: {', '.join(sorted(set(matches.findall(category))))}"
+
+
 def calculate_job_score(row):
     """
     Sistema de scoring 0-100 optimizado para trabajos IT Jr/Trainee.
@@ -96,17 +116,18 @@ def calculate_job_score(row):
     score = 50
     score_details = {"base": 50}
 
-    # Usar texto normalizado
-    title = row.get("title_normalized", "")
-    full_text = row.get("full_text_normalized", "")
-
     # ===== DETECCIÓN DE SEÑALES =====
-    it_signals_found = set(_REGEX_IT_SIGNALS.findall(full_text))
-    weak_it_signals_found = set(_REGEX_WEAK_IT_SIGNALS.findall(full_text))
-    strong_tech_signals_found = set(_REGEX_STRONG_TECH_SIGNALS.findall(full_text))
-    strong_role_found = bool(_REGEX_STRONG_ROLE_SIGNALS.search(title))
-    has_ambiguous_role = bool(_REGEX_AMBIGUOUS_ROLES.search(title))
-    has_positive_seniority = bool(_REGEX_POSITIVE_SENIORITY.search(full_text))
+    # Se leen del análisis de texto (un solo escaneo del texto normalizado)
+    analysis = get_row_text_analysis(row)
+    text_matches = analysis.text
+    title_matches = analysis.title
+
+    it_signals_found = set(text_matches.findall("it_signals"))
+    weak_it_signals_found = set(text_matches.findall("weak_it_signals"))
+    strong_tech_signals_found = set(text_matches.findall("strong_tech"))
+    strong_role_found = title_matches.search("strong_roles")
+    has_ambiguous_role = title_matches.search("ambiguous_roles")
+    has_positive_seniority = text_matches.search("positive_seniority")
 
     all_signals = it_signals_found | weak_it_signals_found
 
@@ -125,7 +146,7 @@ def calculate_job_score(row):
     )
 
     # Verificar si "IT" está explícito en el título
-    has_it_in_title = bool(re.search(r"\bit\b", title))
+    has_it_in_title = title_matches.search("it_word")
 
     # SENIORITY JR/TRAINEE
     if has_positive_seniority:
@@ -144,7 +165,7 @@ def calculate_job_score(row):
         score += bonus
         score_details["bonus_strong_role"] = bonus
         score_details["strong_roles_found"] = sorted(
-            _REGEX_STRONG_ROLE_SIGNALS.findall(title)
+            title_matches.findall("strong_roles")
         )[:3]
 
     # BONUS: "IT" explícito
@@ -200,7 +221,7 @@ def calculate_job_score(row):
         score_details["penalty_only_weak_signals"] = -penalty
 
     if has_positive_seniority and not (strong_role_found or has_it_in_title):
-        title_has_tech = bool(_REGEX_STRONG_TECH_SIGNALS.search(title))
+        title_has_tech = title_matches.search("strong_tech")
         if not title_has_tech:
             penalty = 15
             score -= penalty
@@ -226,12 +247,12 @@ def calculate_job_score(row):
         score -= penalty
         score_details["penalty_ambiguous_role"] = -penalty
         score_details["ambiguous_roles_found"] = sorted(
-            _REGEX_AMBIGUOUS_ROLES.findall(title)
+            title_matches.findall("ambiguous_roles")
         )[:3]
 
     # Experiencia senior
-    should_penalize, years_required = has_senior_experience_requirement(
-        full_text, has_positive_seniority
+    should_penalize, years_required = _senior_experience_penalty(
+        analysis.senior_experience, has_positive_seniority
     )
     if should_penalize:
         penalty = 30
@@ -260,29 +281,24 @@ def has_senior_experience_requirement(text, has_junior_terms):
     Detecta si pide experiencia senior (>=3 años).
     NO penaliza si también menciona términos junior (anuncio multi-nivel).
     """
-    found_senior_req = False
-    max_years_found = 0
-
-    for pattern in SENIOR_EXPERIENCE_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            try:
-                years = int(match)
-                max_years_found = max(max_years_found, years)
-                if years >= MIN_YEARS_SENIORITY:
-                    found_senior_req = True
-                    break
-            except (ValueError, TypeError):
-                continue
-        if found_senior_req:
-            break
+    return _senior_experience_penalty(
+        find_senior_experience_requirement(text), has_junior_terms
+    )
+
+
+def _senior_experience_penalty(senior_requirement, has_junior_terms):
+    """Decide la penalización a partir de un resultado de find_senior_experience_requirement."""
+    if senior_requirement is None:
+        return False, 0
+
+    years_required, _ = senior_requirement
 
     # Si encontró requerimiento senior pero también tiene términos junior
     # → anuncio multi-nivel, no penalizar
-    if found_senior_req and not has_junior_terms:
-        return True, max_years_found
+    if not has_junior_terms:
+        return True, years_required
 
-    return False, max_years_found if found_senior_req else 0
+    return False, years_required
 
 
 def filter_jobs_with_scoring(df, min_score=60, verbose=True):
@@ -300,9 +316,30 @@ def filter_jobs_with_scoring(df, min_score=60, verbose=True):
         return df, pd.DataFrame()
 
     initial_total = len(df)
+    df = df.copy()
+
+    # Lotes grandes sin análisis previo: escaneo, pre-filtro y scoring en un
+    # pool de procesos (el escaneo es la mayor parte del costo)
+    processes = _scoring_processes(df)
+    parallel_results = (
+        _analyze_and_score_parallel(df, processes) if processes > 1 else None
+    )
+
+    if parallel_results is not None:
+        rejection_reasons = [reason for reason, _ in parallel_results]
+        df_pre_filtered, df_rejected_pre_filter = _split_pre_filtered(
+            df, rejection_reasons, verbose
+        )
+        scores_and_details = [
+            scored for reason, scored in parallel_results if reason is None
+        ]
+    else:
+        # Análisis de texto compartido por el pre-filtro y el scoring
+        df[TEXT_ANALYSIS_COLUMN] = get_text_analyses(df)
 
-    # Pre-filtro (área + seniority)
-    df_pre_filtered, df_rejected_pre_filter = pre_filter_jobs(df, verbose=verbose)
+        # Pre-filtro (área + seniority)
+        df_pre_filtered, df_rejected_pre_filter = pre_filter_jobs(df, verbose=verbose)
+        scores_and_details = None
 
     if df_pre_filtered.empty:
         if verbose:
@@ -314,7 +351,8 @@ def filter_jobs_with_scoring(df, min_score=60, verbose=True):
         print(f"\n📊 Calculating scores for {len(df_pre_filtered)} jobs...")
 
     df_scored = df_pre_filtered.copy()
-    scores_and_details = df_scored.apply(calculate_job_score, axis=1)
+    if scores_and_details is None:
+        scores_and_details = list(df_scored.apply(calculate_job_score, axis=1))
     df_scored["score"] = [item[0] for item in scores_and_details]
     df_scored["score_details"] = [item[1] for item in scores_and_details]
 
@@ -395,6 +433,68 @@ def filter_jobs_with_scoring(df, min_score=60, verbose=True):
     return df_final, all_rejected
 
 
+def _scoring_processes(df):
+    """
+    Procesos para puntuar `df`. Se usa el pool solo desde SCORING_PARALLEL_MIN_ROWS
+    filas, con más de un core y si el DataFrame no trae ya el análisis de texto
+    (ej: el pipeline lo calcula en el enrichment): repartir solo el scoring no
+    compensa el costo de levantar los procesos.
+    """
+    cores = os.cpu_count() or 1
+    if (
+        cores == 1
+        or len(df) < SCORING_PARALLEL_MIN_ROWS
+        or TEXT_ANALYSIS_COLUMN in df.columns
+    ):
+        return 1
+    return min(SCORING_PROCESSES or cores, cores)
+
+
+def _analyze_and_score_parallel(df, processes):
+    """
+    Divide los textos normalizados en bloques y los analiza, pre-filtra y
+    puntúa en un pool de procesos. Cada proceso construye los matchers una
+    sola vez al importar este módulo; al padre solo vuelven el motivo de
+    rechazo o el (score, score_details) de cada fila, en orden.
+    Devuelve None si el pool falla (se sigue en un proceso).
+    """
+    titles = get_text_column(df, "title_normalized").tolist()
+    full_texts = get_text_column(df, "full_text_normalized").tolist()
+
+    # Varios bloques por proceso para repartir mejor los textos largos
+    chunk_size = math.ceil(len(df) / (processes * 4))
+    chunks = [
+        (titles[start : start + chunk_size], full_texts[start : start + chunk_size])
+        for start in range(0, len(df), chunk_size)
+    ]
+
+    # spawn: el pipeline corre con threads (fetchers, limpieza), fork no es seguro
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+            results = executor.map(_analyze_and_score_chunk, chunks)
+            return [item for chunk_results in results for item in chunk_results]
+    except Exception as e:
+        print(f"⚠️ Falló el scoring en paralelo, se sigue en un proceso: {e}")
+        return None
+
+
+def _analyze_and_score_chunk(chunk):
+    """(motivo de rechazo, None) o (None, (score, score_details)) por fila."""
+    titles, full_texts = chunk
+    results = []
+    for title, text in zip(titles, full_texts):
+        analysis = analyze_text(title, text)
+        reason = _pre_filter_reason(analysis.title)
+        if reason is not None:
+            results.append((reason, None))
+        else:
+            results.append(
+                (None, calculate_job_score({TEXT_ANALYSIS_COLUMN: analysis}))
+            )
+    return results
+
+
 def normalize_text_series(series: pd.Series):
     """
     Normaliza una columna de texto de un DataFrame:
@@ -1,5 +1,5 @@
-import re
 import asyncio
+import time
 import pandas as pd
 import zoneinfo
 from datetime import datetime, timedelta
@@ -7,100 +7,258 @@ from collections import Counter
 from config import (
     DAYS_OLD_THRESHOLD,
     UPLOAD_TO_FIREBASE,
-    ACCEPTED_JOBS_RETENTION_DAYS,
-    REJECTED_JOBS_RETENTION_DAYS,
+    TRENDS_DAILY_BUCKETS,
+    CLEANUP_DURING_SCRAPE,
+    RUN_REPORT_FILE,
 )
-from utils.date_utils import safe_parse_date_to_ISO
+from utils.constants import _TEXT_SCANNER
+from utils.text_analysis import TEXT_ANALYSIS_COLUMN, analyze_texts
+from utils.date_utils import normalize_date_series
 from utils.scoring_utils import filter_jobs_with_scoring, normalize_text_series
-from bot.utils import send_jobs
+from bot.dispatcher import OutboxDispatcher
 from filters_scoring_config import MIN_SCORE, TAGS_KEYWORDS
 from utils.firestore_utils import (
     get_new_jobs,
     save_jobs_to_firestore,
     save_monthly_trend_data,
-    delete_old_documents,
-    delete_old_trends,
 )
+from utils.cleanup_utils import run_cleanup_async
+from utils.revalidation_utils import close_revalidator
+from utils.metrics_utils import RunReport
+from utils.watermark_utils import track_staged_watermarks
 
 
 async def scrape(sources, channel_id, bot):
+    """
+    Corre el pipeline completo. Devuelve las fuentes de watermark cuyos lotes
+    se guardaron completos (las únicas cuyo watermark puede avanzar).
+    """
     print("🚀 Iniciando búsqueda de trabajos...")
 
-    # 1. FETCH: Llamamos a cada fuente en un thread separado
-    tasks = [asyncio.to_thread(source_func) for source_func in sources]
-    results = await asyncio.gather(*tasks)
-    all_jobs = [job for result in results for job in result]
+    # Tiempos, CPU, memoria y filas de cada etapa (se guardan en RUN_REPORT_FILE)
+    report = RunReport()
 
+    # CLEANUP OLD DOCUMENTS: corre en threads mientras se buscan y procesan
+    # los trabajos, así no demora las notificaciones
+    cleanup_task = None
+    if UPLOAD_TO_FIREBASE and CLEANUP_DURING_SCRAPE:
+        cleanup_task = asyncio.create_task(_run_cleanup(report))
+
+    # Las notificaciones salen por el outbox: una tarea de fondo las envía
+    # mientras se siguen procesando las demás fuentes
+    dispatcher = OutboxDispatcher(
+        bot, channel_id, durable=UPLOAD_TO_FIREBASE, report=report
+    )
+    dispatcher.start()
+
+    try:
+        return await _scrape_sources(sources, dispatcher, report)
+    finally:
+        await dispatcher.close()
+        await close_revalidator()
+        if cleanup_task:
+            await cleanup_task
+
+        print(report.summary())
+        try:
+            report.write(RUN_REPORT_FILE)
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar el reporte de la ejecución: {e}")
+
+
+async def _run_cleanup(report):
+    with report.stage("cleanup") as stage:
+        deleted = await run_cleanup_async()
+        stage["rows_out"] = sum(deleted.values())
+
+
+async def _scrape_sources(sources, dispatcher, report):
+    # 1. FETCH: cada fuente corre en un thread separado y entrega su lote a la
+    # cola apenas termina. Los lotes se procesan a medida que llegan, así las
+    # fuentes rápidas llegan a Telegram sin esperar a la más lenta (JobSpy).
+    queue = asyncio.Queue()
+    producers = [
+        asyncio.create_task(_fetch_into_queue(source_func, queue, report))
+        for source_func in sources
+    ]
+
+    seen_dedupe_keys = set()
+    accepted_batches = []
+    total_jobs = 0
+    saved_batches = 0
+    # Fuentes de watermark cuyos jobs quedaron guardados por completo
+    completed_watermarks = set()
+
+    for _ in producers:
+        source_name, jobs, watermark_sources = await queue.get()
+        total_jobs += len(jobs)
+        if not jobs:
+            completed_watermarks.update(watermark_sources)
+            continue
+
+        df_accepted, saved = await _process_batch(
+            source_name, jobs, dispatcher, seen_dedupe_keys, report
+        )
+        if saved:
+            completed_watermarks.update(watermark_sources)
+        if df_accepted is None:
+            continue
+        saved_batches += 1
+        if not df_accepted.empty:
+            accepted_batches.append(df_accepted)
+
+    await asyncio.gather(*producers)
+
+    if not total_jobs:
+        print("No se obtuvieron trabajos de ninguna fuente.")
+        return completed_watermarks
+
+    if not saved_batches:
+        print("No se encontraron trabajos nuevos en ninguna fuente.")
+        return completed_watermarks
+
+    # Calcular tendencias solo con jobs aceptados (de todos los lotes)
+    if UPLOAD_TO_FIREBASE and accepted_batches:
+        df_accepted = pd.concat(accepted_batches, ignore_index=True)
+        tags_list = [
+            tag
+            for tags_dict in df_accepted["tags"]
+            if isinstance(tags_dict, dict)
+            for tag_group in tags_dict.values()
+            for tag in tag_group
+        ]
+        tags_counts = Counter(tags_list)
+        now = datetime.now(zoneinfo.ZoneInfo("UTC"))
+        month_key = now.strftime("%Y_%m")
+        day_key = now.strftime("%Y_%m_%d") if TRENDS_DAILY_BUCKETS else None
+        trend_data = {"total_jobs": len(df_accepted), "tags": dict(tags_counts)}
+        save_monthly_trend_data(trend_data, month_key, day_key)
+
+    return completed_watermarks
+
+
+async def _fetch_into_queue(source_func, queue, report):
+    """
+    Corre una fuente en un thread y deja en la cola su lote de jobs junto con
+    las fuentes de watermark que preparó (ninguna si el fetch falló).
+    """
+    source_name = getattr(source_func, "__name__", str(source_func))
+    try:
+        jobs, watermark_sources, wall, cpu = await asyncio.to_thread(
+            _timed_fetch, source_func
+        )
+    except Exception as e:
+        print(f"❌ Error en la fuente {source_name}: {e}")
+        jobs, watermark_sources, wall, cpu = [], set(), 0.0, 0.0
+    jobs = jobs or []
+    report.add("fetch", wall, cpu, source=source_name, rows_out=len(jobs))
+    await queue.put((source_name, jobs, watermark_sources))
+
+
+def _timed_fetch(source_func):
+    """Corre la fuente midiendo tiempo real y el CPU de su propio thread."""
+    watermark_sources = track_staged_watermarks()
+    start, cpu_start = time.perf_counter(), time.thread_time()
+    jobs = source_func()
+    wall, cpu = time.perf_counter() - start, time.thread_time() - cpu_start
+    return jobs, watermark_sources, wall, cpu
+
+
+async def _process_batch(source_name, jobs, dispatcher, seen_dedupe_keys, report):
+    """
+    Procesa el lote de una fuente de punta a punta (normalización, dedup,
+    scoring, guardado y envío).
+
+    Returns:
+        (jobs aceptados del lote o None si no tenía trabajos nuevos,
+        True si todos los jobs nuevos quedaron guardados en Firestore).
+    """
     # Conteo por fuente
-    source_counts = Counter(job["source"] for job in all_jobs)
-    print("📊 Trabajos encontrados por fuente:")
+    source_counts = Counter(job["source"] for job in jobs)
+    print(f"📊 Trabajos encontrados ({source_name}):")
     for source, count in source_counts.items():
         print(f"- {source}: {count}")
 
-    if not all_jobs:
-        print("No se obtuvieron trabajos de ninguna fuente.")
-        return
-
-    df = pd.DataFrame(all_jobs)
+    df = pd.DataFrame(jobs)
 
     # 3. NORMALIZACIÓN DE TEXTO
-    df["title_normalized"] = normalize_text_series(df["title"])
-    df["description_normalized"] = normalize_text_series(df["description"])
-    df["full_text_normalized"] = (
-        df["title_normalized"] + " " + df["description_normalized"]
-    )
+    with report.stage("normalize", source_name, rows_in=len(df)):
+        df["title_normalized"] = normalize_text_series(df["title"])
+        df["description_normalized"] = normalize_text_series(df["description"])
+        df["full_text_normalized"] = (
+            df["title_normalized"] + " " + df["description_normalized"]
+        )
 
-    # 2. DEDUPLICATION LOCAL
-    df["dedupe_key"] = (
-        df["title_normalized"] + "|" + df["company"].str.lower().str.strip()
-    )
+    # 2. DEDUPLICATION LOCAL (también contra los lotes ya procesados)
+    with report.stage("dedup", source_name, rows_in=len(df)) as stage:
+        df["dedupe_key"] = (
+            df["title_normalized"] + "|" + df["company"].str.lower().str.strip()
+        )
 
-    df.drop_duplicates(subset=["dedupe_key"], inplace=True)
-    df.drop(columns=["dedupe_key"], inplace=True)
+        df.drop_duplicates(subset=["dedupe_key"], inplace=True)
+        df = df[~df["dedupe_key"].isin(seen_dedupe_keys)].copy()
+        seen_dedupe_keys.update(df["dedupe_key"])
+        df.drop(columns=["dedupe_key"], inplace=True)
+        stage["rows_out"] = len(df)
 
     # 3. NORMALIZACIÓN DE FECHAS
-    df["published_at"] = df["published_at"].apply(safe_parse_date_to_ISO)
-    df["published_at"] = pd.to_datetime(df["published_at"], errors="coerce")
-    df.dropna(subset=["published_at"], inplace=True)
-
     # 4. FILTRADO POR FECHA (lo antes posible)
-    cutoff_date = datetime.now(zoneinfo.ZoneInfo("UTC")).date() - timedelta(
-        days=DAYS_OLD_THRESHOLD
-    )
-    df = df[df["published_at"].dt.date >= cutoff_date]
+    with report.stage("date_parse", source_name, rows_in=len(df)) as stage:
+        df["published_at"] = normalize_date_series(df["published_at"])
+        df.dropna(subset=["published_at"], inplace=True)
+
+        cutoff_date = datetime.now(zoneinfo.ZoneInfo("UTC")).date() - timedelta(
+            days=DAYS_OLD_THRESHOLD
+        )
+        df = df[df["published_at"].dt.date >= cutoff_date]
+        stage["rows_out"] = len(df)
 
     if df.empty:
         print("No hay trabajos recientes después del filtrado por fecha.")
-        return
+        return None, True
 
     print(f"Total de jobs únicos y recientes: {len(df)}")
 
     # 5. DEDUPLICATION FIREBASE (antes del enrichment)
     if UPLOAD_TO_FIREBASE:
-        new_jobs_list = get_new_jobs(df.to_dict("records"))
+        with report.stage("firestore_dedup", source_name, rows_in=len(df)) as stage:
+            # Consultas bloqueantes (con reintentos): fuera del event loop, así
+            # los envíos y la revalidación siguen corriendo mientras tanto
+            new_jobs_list = await asyncio.to_thread(get_new_jobs, df.to_dict("records"))
+            stage["rows_out"] = len(new_jobs_list)
         if not new_jobs_list:
             print(
                 "No se encontraron trabajos nuevos después de la deduplicación con Firebase."
             )
-            return
+            return None, True
         df = pd.DataFrame(new_jobs_list)
         print(f"✨ {len(df)} trabajos nuevos después de deduplicación con Firebase.")
 
     if df.empty:
         print("No se encontraron trabajos nuevos.")
-        return
+        return None, True
 
     # 6. ENRICHMENT (solo para jobs nuevos)
-    df["tags"] = df["full_text_normalized"].apply(extract_tags)
-    df["modality"] = df["full_text_normalized"].apply(extract_job_modality)
+    # Un solo escaneo por job: tags, modalidad, pre-filtro y scoring lo reutilizan
+    with report.stage("enrich", source_name, rows_in=len(df)):
+        df[TEXT_ANALYSIS_COLUMN] = analyze_texts(df)
+        df["tags"] = df[TEXT_ANALYSIS_COLUMN].map(
+            lambda analysis: tags_from_matches(analysis.text)
+        )
+        df["modality"] = df[TEXT_ANALYSIS_COLUMN].map(
+            lambda analysis: modality_from_matches(analysis.text)
+        )
 
     # Marcar fecha y hora del scraping
     df["date_scraped"] = datetime.now(zoneinfo.ZoneInfo("UTC")).isoformat()
 
     # 7. SCORING (todos los jobs pasan por scoring)
-    df_accepted, df_rejected = filter_jobs_with_scoring(
-        df, min_score=MIN_SCORE, verbose=True
-    )
+    with report.stage("score", source_name, rows_in=len(df)) as stage:
+        # CPU (o el pool de procesos en lotes grandes): también fuera del event loop
+        df_accepted, df_rejected = await asyncio.to_thread(
+            filter_jobs_with_scoring, df, min_score=MIN_SCORE, verbose=True
+        )
+        stage["rows_out"] = len(df_accepted)
 
     # Asignar estado antes de guardar
     if not df_accepted.empty:
@@ -113,92 +271,80 @@ async def scrape(sources, channel_id, bot):
     df_all_scored_jobs = pd.concat([df_accepted, df_rejected], ignore_index=True)
 
     # Eliminar campos normalizados antes de guardar en Firestore
-    columns_to_drop = ["title_normalized", "description_normalized", "full_text_normalized"]
+    columns_to_drop = [
+        "title_normalized",
+        "description_normalized",
+        "full_text_normalized",
+        TEXT_ANALYSIS_COLUMN,
+    ]
     df_all_scored_jobs.drop(columns=columns_to_drop, errors="ignore", inplace=True)
 
-    # 8. GUARDAR TODOS LOS JOBS NUEVOS (aceptados y rechazados)
-    all_new_jobs_list = df_all_scored_jobs.to_dict("records")
-
-    if UPLOAD_TO_FIREBASE:
-        print(
-            f"💾 Guardando {len(all_new_jobs_list)} jobs nuevos (aceptados + rechazados)..."
-        )
-        await save_jobs_to_firestore(all_new_jobs_list)
-
-    # 9. ENVIAR SOLO LOS ACEPTADOS
+    # 8. ENCOLAR LOS ACEPTADOS EN EL OUTBOX (antes de marcarlos como guardados,
+    # así un job aceptado nunca queda sin notificar)
     if df_accepted.empty:
         print("No hay trabajos aceptados para enviar al bot.")
     else:
         print(
             f"✅ Se encontraron {len(df_accepted)} jobs aceptados. Enviando al bot..."
         )
-        accepted_jobs_list = df_accepted.to_dict("records")
-
-        if UPLOAD_TO_FIREBASE:
-            # Calcular tendencias solo con jobs aceptados
-            tags_list = [
-                tag
-                for tags_dict in df_accepted["tags"]
-                if isinstance(tags_dict, dict)
-                for tag_group in tags_dict.values()
-                for tag in tag_group
-            ]
-            tags_counts = Counter(tags_list)
-            month_key = datetime.now(zoneinfo.ZoneInfo("UTC")).strftime("%Y_%m")
-            trend_data = {"total_jobs": len(df_accepted), "tags": dict(tags_counts)}
-            save_monthly_trend_data(trend_data, month_key)
-
-        await send_jobs(bot, channel_id, accepted_jobs_list)
-
-    # 10. CLEANUP OLD DOCUMENTS
+        accepted_jobs_list = df_accepted.drop(
+            columns=columns_to_drop, errors="ignore"
+        ).to_dict("records")
+        await dispatcher.enqueue(accepted_jobs_list)
+
+    # 9. GUARDAR TODOS LOS JOBS NUEVOS (aceptados y rechazados)
+    all_new_jobs_list = df_all_scored_jobs.to_dict("records")
+
+    saved = False
     if UPLOAD_TO_FIREBASE:
-        # Borrar jobs aceptados antiguos
-        delete_old_documents(
-            "jobs", ACCEPTED_JOBS_RETENTION_DAYS, status="accepted"
-        )
-        # Borrar jobs rechazados antiguos (con mayor frecuencia)
-        delete_old_documents(
-            "jobs", REJECTED_JOBS_RETENTION_DAYS, status="rejected"
+        print(
+            f"💾 Guardando {len(all_new_jobs_list)} jobs nuevos (aceptados + rechazados)..."
         )
-        delete_old_trends(ACCEPTED_JOBS_RETENTION_DAYS)
+        with report.stage("save", source_name, rows_in=len(all_new_jobs_list)):
+            saved = await save_jobs_to_firestore(all_new_jobs_list)
+
+    return df_accepted, saved
 
 
 def extract_tags(text_for_extraction):
     """Extrae tags de un texto ya normalizado en minúsculas"""
+    return tags_from_matches(_TEXT_SCANNER.scan(text_for_extraction))
+
+
+def extract_tags_series(texts: pd.Series):
+    """Extrae tags de una columna completa de textos normalizados (ej: full_text_normalized)"""
+    return texts.fillna("").astype(str).map(extract_tags)
+
+
+def tags_from_matches(matches):
+    """Arma el dict {categoría: keywords} a partir de un escaneo ya hecho"""
     found_tags = {}
     for category, keywords in TAGS_KEYWORDS.items():
-        found_keywords = []
-        for kw in keywords:
-            pattern = r"(?<!\w)" + re.escape(kw) + r"(?!\w)"
-            if re.search(pattern, text_for_extraction, re.IGNORECASE):
-                found_keywords.append(kw)
-        if found_keywords:
-            found_tags[category] = found_keywords
+        found_orders = matches.found_orders(f"tags:{category}")
+        if not found_orders:
+            continue
+        found_terms = {keywords[order].lower() for order in found_orders}
+        found_tags[category] = [kw for kw in keywords if kw.lower() in found_terms]
     return found_tags
 
 
 def extract_job_modality(text_for_extraction):
     """Extrae modalidad de trabajo de un texto ya normalizado en minúsculas"""
+    return modality_from_matches(_TEXT_SCANNER.scan(text_for_extraction))
+
+
+def modality_from_matches(matches):
+    """Determina la modalidad de trabajo a partir de un escaneo ya hecho"""
     # 100% presencial
-    if re.search(
-        r"\b(100%\s*(on-site|onsite|presencial)|exclusivamente\s*presencial)\b",
-        text_for_extraction,
-    ):
+    if matches.search("modality:on_site_only"):
         return "On-site"
 
     # Términos remotos y presenciales
-    remote_terms = (
-        r"\b(remoto|remote|desde\s*casa|work\s*from\s*home|wfh|teletrabajo|anywhere)\b"
-    )
-    onsite_terms = (
-        r"\b(presencial|on-site|onsite|oficina|sede|caba|buenos\s*aires|viajes)\b"
-    )
-
-    is_remote_mentioned = re.search(remote_terms, text_for_extraction)
-    is_onsite_mentioned = re.search(onsite_terms, text_for_extraction)
+    is_remote_mentioned = matches.search("modality:remote")
+    is_onsite_mentioned = matches.search("modality:on_site")
 
     # Híbrido: explícitamente mencionado o ambos términos presentes
-    if re.search(r"\b(híbrido|hybrid|mixto)\b", text_for_extraction) or (
+    if matches.search("modality:hybrid") or (
         is_remote_mentioned and is_onsite_mentioned
     ):
         return "Hybrid"
@@ -0,0 +1,152 @@
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+from config import (
+    ACCEPTED_JOBS_RETENTION_DAYS,
+    REJECTED_JOBS_RETENTION_DAYS,
+    SEEN_IDS_DB,
+)
+
+
+class BloomFilter:
+    """Filtro de Bloom simple: sin falsos negativos, falsos positivos acotados."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class SeenIdStore:
+    """
+    Conjunto local de IDs de jobs ya guardados en Firestore.
+
+    - Un filtro de Bloom en memoria descarta rápido los IDs nunca vistos.
+    - La tabla SQLite es el conjunto exacto (id, status, seen_at).
+    - Se poda con las mismas retenciones que Firestore, así un job borrado
+      allá vuelve a considerarse nuevo acá también.
+    """
+
+    def __init__(self, path=SEEN_IDS_DB):
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_ids ("
+            "id TEXT PRIMARY KEY, status TEXT, seen_at TEXT NOT NULL)"
+        )
+        self.prune()
+        self._build_bloom()
+
+    def _build_bloom(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM seen_ids").fetchone()[0]
+        self._bloom = BloomFilter(capacity=max(1000, count * 2))
+        for (job_id,) in self._conn.execute("SELECT id FROM seen_ids"):
+            self._bloom.add(job_id)
+
+    def known(self, job_ids):
+        """Devuelve el subconjunto de job_ids que ya está en el índice local."""
+        candidates = [job_id for job_id in job_ids if job_id in self._bloom]
+        if not candidates:
+            return set()
+
+        known_ids = set()
+        with self._lock:
+            # SQLite admite hasta 999 parámetros por consulta
+            for i in range(0, len(candidates), 900):
+                chunk = candidates[i : i + 900]
+                placeholders = ",".join("?" * len(chunk))
+                known_ids.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        f"SELECT id FROM seen_ids WHERE id IN ({placeholders})", chunk
+                    )
+                )
+        return known_ids
+
+    def add(self, entries):
+        """Registra IDs vistos. entries: iterable de (id, status, seen_at ISO o None)."""
+        now_iso = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (str(job_id), status, seen_at or now_iso)
+            for job_id, status, seen_at in entries
+            if job_id
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_ids (id, status, seen_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            for job_id, _, _ in rows:
+                self._bloom.add(job_id)
+
+    def prune(self):
+        """Elimina los IDs más viejos que la retención de su estado."""
+        now = datetime.now(timezone.utc)
+        accepted_cutoff = (
+            now - timedelta(days=ACCEPTED_JOBS_RETENTION_DAYS)
+        ).isoformat()
+        rejected_cutoff = (
+            now - timedelta(days=REJECTED_JOBS_RETENTION_DAYS)
+        ).isoformat()
+
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM seen_ids WHERE "
+                "(status = 'rejected' AND seen_at < ?) OR "
+                "(COALESCE(status, '') != 'rejected' AND seen_at < ?)",
+                (rejected_cutoff, accepted_cutoff),
+            ).rowcount
+            self._conn.commit()
+
+        if deleted:
+            print(f"🧹 {deleted} IDs vencidos eliminados del índice local.")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_seen_store():
+    """Abre (una sola vez) el índice local de IDs vistos. Devuelve None si no se puede."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = SeenIdStore()
+            except sqlite3.Error as e:
+                print(
+                    f"⚠️ No se pudo abrir el índice local de IDs ({SEEN_IDS_DB}): {e}"
+                )
+                return None
+        return _store
@@ -0,0 +1,173 @@
+import re
+
+# Claves reservadas en los nodos del trie: términos que terminan ahí y
+# transición que acepta cualquier cantidad de espacios (`\s*`)
+_TERMINALS = None
+_ANY_SPACE = "\\s*"
+
+
+def is_word_char(char):
+    """Equivalente a `\\w` de `re` para strings (letras, dígitos y '_')."""
+    return char.isalnum() or char == "_"
+
+
+def _ordered_terms(terms):
+    """
+    Términos en el orden en que compiten en una alternación. Las listas conservan
+    su orden; los sets (cuyo orden de iteración cambia entre procesos) se ordenan
+    del más largo al más corto, así gana siempre la coincidencia más específica.
+    """
+    if isinstance(terms, (set, frozenset)):
+        return sorted(terms, key=lambda term: (-len(term), term))
+    return list(terms)
+
+
+class TermScanner:
+    """
+    Escáner multi-patrón para listas de términos literales.
+
+    Reemplaza a las alternaciones `(?<!\\w)término(?!\\w)` (con IGNORECASE) de
+    `utils.constants`: recorre el texto una sola vez con un trie anclado en los
+    límites de palabra y devuelve todas las apariciones etiquetadas por categoría.
+    """
+
+    def __init__(self, categories, flexible_whitespace=()):
+        """
+        Args:
+            categories: dict {categoría: iterable de términos}. El orden de los
+                términos importa igual que en una alternación de regex.
+            flexible_whitespace: categorías en las que cada espacio del término
+                equivale a `\\s*` (cero o más espacios, como en las regex de modalidad).
+        """
+        self.categories = list(categories)
+        self._trie = {}
+
+        first_chars = set()
+        for category, terms in categories.items():
+            flexible = category in flexible_whitespace
+            for order, term in enumerate(_ordered_terms(terms)):
+                key = term.lower()
+                if flexible:
+                    key = key.split()
+                if not key:
+                    continue
+                first_chars.add(key[0][0])
+
+                node = self._trie
+                for index, chunk in enumerate(key):
+                    if flexible and index > 0:
+                        node = node.setdefault(_ANY_SPACE, {})
+                    for char in chunk:
+                        node = node.setdefault(char, {})
+
+                terminals = node.setdefault(_TERMINALS, [])
+                # Un término repetido nunca gana en la alternación: se ignora
+                if not any(cat == category for cat, _ in terminals):
+                    terminals.append((category, order))
+
+        # Posiciones candidatas: no precedidas por un carácter de palabra y
+        # que empiezan con el primer carácter de algún término
+        self._start_regex = re.compile(
+            r"(?<!\w)[" + "".join(re.escape(c) for c in sorted(first_chars)) + "]"
+        )
+
+    def scan(self, text):
+        """Recorre el texto una vez y devuelve un `TermMatches` con las apariciones."""
+        if not text:
+            return TermMatches(text or "", {})
+
+        # Equivalente a IGNORECASE: se busca sobre el texto en minúsculas
+        # (si al pasarlo a minúsculas cambia la longitud se usa el original)
+        folded = text.lower()
+        if len(folded) != len(text):
+            folded = text
+
+        trie = self._trie
+        length = len(folded)
+        occurrences = {}
+
+        for start_match in self._start_regex.finditer(folded):
+            start = start_match.start()
+            # Caminos pendientes (nodo, posición); solo hay más de uno cuando
+            # un término admite espacios flexibles
+            pending = [(trie, start)]
+            while pending:
+                node, pos = pending.pop()
+                while True:
+                    any_space = node.get(_ANY_SPACE)
+                    if any_space is not None:
+                        skip = pos
+                        pending.append((any_space, skip))
+                        while skip < length and folded[skip].isspace():
+                            skip += 1
+                            pending.append((any_space, skip))
+
+                    if pos >= length:
+                        break
+                    node = node.get(folded[pos])
+                    if node is None:
+                        break
+                    pos += 1
+                    terminals = node.get(_TERMINALS)
+                    if terminals and (pos == length or not is_word_char(folded[pos])):
+                        for category, order in terminals:
+                            occurrences.setdefault(category, []).append(
+                                (start, pos, order)
+                            )
+
+        return TermMatches(text, occurrences)
+
+    @staticmethod
+    def is_prefix(prefix, text):
+        """
+        Indica si las apariciones de `prefix` pueden leerse de las de `text`
+        (ej: el título dentro de `title + " " + description`).
+        """
+        end = len(prefix)
+        return text.startswith(prefix) and (
+            end == len(text) or not is_word_char(text[end])
+        )
+
+
+class TermMatches:
+    """Resultado de `TermScanner.scan`: apariciones por categoría."""
+
+    __slots__ = ("text", "occurrences")
+
+    def __init__(self, text, occurrences):
+        self.text = text
+        # {categoría: [(inicio, fin, orden del término), ...]} ordenado por inicio
+        self.occurrences = occurrences
+
+    def search(self, category):
+        """Equivalente a `bool(regex.search(text))`."""
+        return bool(self.occurrences.get(category))
+
+    def found_orders(self, category):
+        """Posiciones (en la lista de la categoría) de los términos que aparecen."""
+        return {order for _, _, order in self.occurrences.get(category, ())}
+
+    def findall(self, category):
+        """
+        Equivalente a `regex.findall(text)`: apariciones sin solapamiento,
+        de izquierda a derecha, ganando el primer término de la lista.
+        """
+        found = []
+        cursor = 0
+        for start, end, _ in sorted(
+            self.occurrences.get(category, ()), key=lambda occ: (occ[0], occ[2])
+        ):
+            if start >= cursor:
+                found.append(self.text[start:end])
+                cursor = end
+        return found
+
+    def prefix(self, length):
+        """Restringe las apariciones a las que terminan dentro de `text[:length]`."""
+        return TermMatches(
+            self.text[:length],
+            {
+                category: [occ for occ in occs if occ[1] <= length]
+                for category, occs in self.occurrences.items()
+            },
+        )
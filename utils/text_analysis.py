@@ -0,0 +1,140 @@
+import pandas as pd
+from filters_scoring_config import MIN_YEARS_SENIORITY, SENIOR_EXPERIENCE_PATTERNS
+from utils.constants import _REGEX_SENIOR_EXPERIENCE, _TEXT_SCANNER
+
+# Columna donde se guarda el análisis de cada job (se descarta antes de guardar)
+TEXT_ANALYSIS_COLUMN = "text_analysis"
+
+
+class TextAnalysis:
+    """
+    Resultado del escaneo único de un job. El pre-filtro, el scoring, los tags
+    y la modalidad leen sus señales de acá en lugar de volver a recorrer el texto.
+    """
+
+    __slots__ = ("text", "title", "_senior_experience")
+
+    def __init__(self, text_matches, title_matches):
+        # TermMatches del texto completo (título + descripción) y del título
+        self.text = text_matches
+        self.title = title_matches
+
+    @property
+    def senior_experience(self):
+        """(años, patrón) del requisito de experiencia senior, o None. Se calcula una vez."""
+        try:
+            return self._senior_experience
+        except AttributeError:
+            self._senior_experience = find_senior_experience_requirement(
+                self.text.text
+            )
+            return self._senior_experience
+
+
+def analyze_text(title, full_text):
+    """Escanea el texto completo una sola vez (ambos ya normalizados en minúsculas)."""
+    title = title or ""
+    full_text = full_text or ""
+
+    text_matches = _TEXT_SCANNER.scan(full_text)
+    # El título es el comienzo de full_text: sus señales salen del mismo escaneo
+    if _TEXT_SCANNER.is_prefix(title, full_text):
+        title_matches = text_matches.prefix(len(title))
+    else:
+        title_matches = _TEXT_SCANNER.scan(title)
+
+    return TextAnalysis(text_matches, title_matches)
+
+
+def analyze_texts(df):
+    """Analiza todos los jobs de un DataFrame (title_normalized + full_text_normalized)."""
+    titles = get_text_column(df, "title_normalized")
+    full_texts = get_text_column(df, "full_text_normalized")
+    return pd.Series(
+        [analyze_text(title, text) for title, text in zip(titles, full_texts)],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def get_text_analyses(df):
+    """Devuelve la columna de análisis del DataFrame, calculando las filas que no lo tengan."""
+    if TEXT_ANALYSIS_COLUMN not in df.columns:
+        return analyze_texts(df)
+
+    titles = get_text_column(df, "title_normalized")
+    full_texts = get_text_column(df, "full_text_normalized")
+    return pd.Series(
+        [
+            (
+                analysis
+                if isinstance(analysis, TextAnalysis)
+                else analyze_text(title, text)
+            )
+            for analysis, title, text in zip(
+                df[TEXT_ANALYSIS_COLUMN], titles, full_texts
+            )
+        ],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def get_row_text_analysis(row):
+    """Análisis de una fila (dict o Series); lo calcula si la fila no lo trae."""
+    analysis = row.get(TEXT_ANALYSIS_COLUMN)
+    if isinstance(analysis, TextAnalysis):
+        return analysis
+    return analyze_text(
+        row.get("title_normalized", ""), row.get("full_text_normalized", "")
+    )
+
+
+def get_text_column(df, column):
+    """Devuelve una columna de texto como Series de strings (vacía si no existe)."""
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[column].fillna("").astype(str)
+
+
+def find_senior_experience_requirement(text):
+    """
+    Busca el primer requisito de años >= MIN_YEARS_SENIORITY en una sola pasada.
+    Respeta la prioridad de SENIOR_EXPERIENCE_PATTERNS: gana el primer patrón
+    (en orden) que pida años suficientes y, dentro de él, su primera aparición.
+
+    Returns:
+        (años, patrón) o None si no pide experiencia senior.
+    """
+    pattern_count = len(SENIOR_EXPERIENCE_PATTERNS)
+    # Fin de la última coincidencia de cada patrón (como en re.findall)
+    last_end = [0] * pattern_count
+    best = None
+
+    for match in _REGEX_SENIOR_EXPERIENCE.finditer(text):
+        position = match.start()
+        # Solo interesan los patrones con más prioridad que el mejor encontrado
+        for i in range(best[0] if best else pattern_count):
+            end = match.end(f"pattern_{i}")
+            if end < 0 or position < last_end[i]:
+                continue
+            last_end[i] = end
+
+            try:
+                years = int(match.group(f"years_{i}"))
+            except ValueError:
+                continue
+
+            if years >= MIN_YEARS_SENIORITY:
+                best = (i, years)
+                break
+
+        # Ningún patrón puede superar al primero
+        if best and best[0] == 0:
+            break
+
+    if best is None:
+        return None
+
+    pattern_index, years = best
+    return years, SENIOR_EXPERIENCE_PATTERNS[pattern_index]
@@ -0,0 +1,190 @@
+import json
+import math
+import os
+import threading
+from datetime import date, datetime, timezone
+
+from config import (
+    UPLOAD_TO_FIREBASE,
+    WATERMARK_LOOKBACK_HOURS,
+    WATERMARKS_FILE,
+    WATERMARKS_FIRESTORE_BACKUP,
+)
+
+WATERMARKS_DOCUMENT = "watermarks"
+
+_lock = threading.Lock()
+_watermarks = None
+_pending = {}
+# Fuentes que prepararon watermark en el thread actual (ver track_staged_watermarks)
+_local = threading.local()
+
+
+def get_watermark(source):
+    """
+    Devuelve el watermark de una fuente o None:
+    {"published_at": timestamp, "ids": [...], "fetched_at": timestamp}
+    """
+    with _lock:
+        return _load_watermarks().get(source)
+
+
+def get_watermark_cutoff(source):
+    """
+    Timestamp desde el que se consideran los avisos de una fuente: el
+    published_at del watermark menos WATERMARK_LOOKBACK_HOURS, o None.
+    """
+    watermark = get_watermark(source)
+    if not watermark or watermark.get("published_at") is None:
+        return None
+    return watermark["published_at"] - WATERMARK_LOOKBACK_HOURS * 3600
+
+
+def filter_jobs_after_watermark(source, jobs):
+    """
+    Devuelve solo los jobs posteriores al watermark de la fuente menos
+    WATERMARK_LOOKBACK_HOURS y deja preparado el nuevo watermark (se guarda
+    con commit_watermarks(sources)).
+
+    El margen conserva avisos indexados tarde o retrofechados: un job nunca
+    visto con fecha apenas anterior al watermark no se pierde, y los que ya
+    se guardaron dentro del margen los descarta después get_new_jobs. Solo
+    se saltean sin consultar los IDs del propio watermark y los más viejos
+    que el margen. Los jobs sin fecha interpretable se conservan siempre.
+    """
+    fetched_at = datetime.now(timezone.utc).timestamp()
+
+    with _lock:
+        current = _pending.get(source) or _load_watermarks().get(source) or {}
+        latest = current.get("published_at")
+        latest_ids = set(current.get("ids", []))
+        cutoff = None if latest is None else latest - WATERMARK_LOOKBACK_HOURS * 3600
+
+        new_jobs = []
+        for job in jobs:
+            published = published_timestamp(job.get("published_at"))
+            job_id = str(job.get("id"))
+
+            if published is None or cutoff is None:
+                new_jobs.append(job)
+            elif published < cutoff or (published == latest and job_id in latest_ids):
+                continue
+            else:
+                new_jobs.append(job)
+
+            if published is None:
+                continue
+            if latest is None or published > latest:
+                latest = published
+                latest_ids = {job_id}
+            elif published == latest:
+                latest_ids.add(job_id)
+
+        _pending[source] = {
+            "published_at": latest,
+            "ids": sorted(latest_ids),
+            "fetched_at": fetched_at,
+        }
+        staged = getattr(_local, "sources", None)
+        if staged is not None:
+            staged.add(source)
+
+    skipped = len(jobs) - len(new_jobs)
+    if skipped:
+        print(f"⏭️ {source}: {skipped} avisos ya vistos según el watermark.")
+    return new_jobs
+
+
+def track_staged_watermarks():
+    """
+    Empieza a registrar qué fuentes preparan watermark en el thread actual.
+    Devuelve el set que se va completando (llamar antes de correr un fetcher).
+    """
+    _local.sources = set()
+    return _local.sources
+
+
+def commit_watermarks(sources):
+    """
+    Guarda los watermarks preparados de `sources`: solo las fuentes cuyos jobs
+    se guardaron completos en Firestore. Sin UPLOAD_TO_FIREBASE no se guarda
+    nada, así una ejecución de prueba no consume avisos reales.
+    """
+    if not UPLOAD_TO_FIREBASE:
+        return
+
+    with _lock:
+        ready = {source: _pending[source] for source in sources if source in _pending}
+        skipped = sorted(set(_pending) - set(ready))
+        if skipped:
+            print(
+                f"⚠️ Watermarks sin actualizar (guardado incompleto): {', '.join(skipped)}"
+            )
+        if not ready:
+            return
+        watermarks = dict(_load_watermarks())
+        watermarks.update(ready)
+
+        try:
+            os.makedirs(os.path.dirname(WATERMARKS_FILE) or ".", exist_ok=True)
+            tmp_path = f"{WATERMARKS_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(watermarks, f, indent=2)
+            os.replace(tmp_path, WATERMARKS_FILE)
+        except OSError as e:
+            print(f"⚠️ No se pudieron guardar los watermarks: {e}")
+
+        if UPLOAD_TO_FIREBASE and WATERMARKS_FIRESTORE_BACKUP:
+            from utils.firestore_utils import save_state_document
+
+            save_state_document(WATERMARKS_DOCUMENT, watermarks)
+
+        global _watermarks
+        _watermarks = watermarks
+        _pending.clear()
+        print(f"🔖 Watermarks actualizados: {', '.join(sorted(ready))}")
+
+
+def published_timestamp(value):
+    """Convierte published_at (timestamp, date, datetime o ISO) a timestamp UTC."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return None if math.isnan(value) else float(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        try:
+            return value.timestamp()
+        except ValueError:
+            return None
+    if isinstance(value, date):
+        midnight = datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+        return midnight.timestamp()
+    if isinstance(value, str):
+        try:
+            return published_timestamp(datetime.fromisoformat(value.strip()))
+        except ValueError:
+            return None
+    return None
+
+
+def _load_watermarks():
+    """Carga los watermarks del archivo local (o de Firestore si no hay archivo)."""
+    global _watermarks
+    if _watermarks is not None:
+        return _watermarks
+
+    _watermarks = {}
+    try:
+        with open(WATERMARKS_FILE, "r", encoding="utf-8") as f:
+            _watermarks = json.load(f)
+    except FileNotFoundError:
+        if UPLOAD_TO_FIREBASE and WATERMARKS_FIRESTORE_BACKUP:
+            from utils.firestore_utils import get_state_document
+
+            _watermarks = get_state_document(WATERMARKS_DOCUMENT) or {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ No se pudieron leer los watermarks: {e}")
+
+    return _watermarks